@@ -312,13 +312,6 @@ Development Installer - Run directly with Python
 For development and testing purposes
 """
 
-import sys
-import os
-
-# Add current directory to path so we can import setup_installer
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-# Import and run the installer
 from setup_installer_simple import main
 
 if __name__ == "__main__":
@@ -8,12 +8,56 @@ from tkinter import ttk, messagebox, filedialog
 import os
 import sys
 import platform
+import re
 import subprocess
 import threading
+import queue
 import json
 import shutil
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+PLATFORM_SYSTEM = platform.system()
+PLATFORM_NODE = platform.node()
+
+PUBLIC_DESKTOP = Path("C:/Users/Public/Desktop")
+
+PATH_RE = re.compile(r'^([A-Za-z]:[\\/]|/|\\\\).+')
+
+def _satisfied(spec):
+    """True if an installed distribution already meets the requirement spec"""
+    try:
+        from importlib import metadata as importlib_metadata
+    except ImportError:
+        return False
+    try:
+        from packaging.requirements import Requirement
+    except ImportError:
+        try:
+            from pip._vendor.packaging.requirements import Requirement
+        except ImportError:
+            return False
+    
+    try:
+        requirement = Requirement(spec)
+    except Exception:
+        return False
+    try:
+        installed = importlib_metadata.version(requirement.name)
+    except importlib_metadata.PackageNotFoundError:
+        return False
+    return requirement.specifier.contains(installed, prereleases=True)
+
+def _missing_requirements(requirements):
+    """Requirement specs from the file that are not already installed"""
+    missing = []
+    for line in Path(requirements).read_text(encoding="utf-8").splitlines():
+        spec = line.split("#", 1)[0].strip()
+        if spec and not spec.startswith("-") and not _satisfied(spec):
+            missing.append(spec)
+    return missing
+
 class RenderFarmInstaller:
     def __init__(self):
         self.root = tk.Tk()
@@ -36,6 +80,14 @@ class RenderFarmInstaller:
         # State
         self.current_step = 0
         self.installation_complete = False
+        self.install_dir = None
+        self.settings = {}
+        
+        self._log_queue = deque()
+        self._log_lock = threading.Lock()
+        self._log_flush_pending = False
+        self._progress_state = None
+        self._progress_pending = False
         
         self.create_ui()
     
@@ -46,7 +98,7 @@ class RenderFarmInstaller:
         self.root.geometry(f"700x550+{x}+{y}")
     
     def get_default_install_path(self):
-        if platform.system() == "Windows":
+        if PLATFORM_SYSTEM == "Windows":
             # Use user directory instead of Program Files to avoid permission issues
             user_dir = Path.home()
             return str(user_dir / "RenderFarm")
@@ -89,32 +141,42 @@ class RenderFarmInstaller:
                                     bg="#0066cc", fg="white")
         self.next_button.pack(side="left")
         
+        self.installation_started = False
+        self.steps = [
+            self.build_welcome(),
+            self.build_installation_type(),
+            self.build_configuration(),
+            self.build_installation(),
+            self.build_complete(),
+        ]
+        self.step_hooks = [None, None, None, self.start_installation, self.refresh_complete]
+        
         # Show first step
         self.show_step()
     
     def show_step(self):
-        # Clear content
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
-        if self.current_step == 0:
-            self.show_welcome()
-        elif self.current_step == 1:
-            self.show_installation_type()
-        elif self.current_step == 2:
-            self.show_configuration()
-        elif self.current_step == 3:
-            self.show_installation()
-        elif self.current_step == 4:
-            self.show_complete()
+        for frame in self.steps:
+            frame.pack_forget()
+        
+        hook = self.step_hooks[self.current_step]
+        if hook is not None:
+            hook()
         
+        self.steps[self.current_step].pack(fill="both", expand=True)
         self.update_buttons()
     
-    def show_welcome(self):
-        tk.Label(self.content_frame, text="Welcome to Render Farm Setup", 
+    def start_installation(self):
+        if not self.installation_started:
+            self.installation_started = True
+            threading.Thread(target=self.run_installation, daemon=True).start()
+    
+    def build_welcome(self):
+        page = tk.Frame(self.content_frame, bg="#ffffff")
+        
+        tk.Label(page, text="Welcome to Render Farm Setup", 
                 font=("Arial", 16, "bold"), bg="#ffffff").pack(pady=(0, 20))
         
-        tk.Label(self.content_frame, 
+        tk.Label(page, 
                 text="This will install the Professional VFX Render Farm on your computer.",
                 font=("Arial", 11), bg="#ffffff").pack(pady=(0, 20))
         
@@ -124,22 +186,26 @@ class RenderFarmInstaller:
 • Central worker management
 • Optimized resource usage"""
         
-        tk.Label(self.content_frame, text=features_text, 
+        tk.Label(page, text=features_text, 
                 font=("Arial", 10), bg="#ffffff", justify="left").pack(pady=(0, 20))
         
-        req_frame = tk.LabelFrame(self.content_frame, text="Requirements", 
+        req_frame = tk.LabelFrame(page, text="Requirements", 
                                  font=("Arial", 10, "bold"))
         req_frame.pack(fill="x", pady=20)
         
         tk.Label(req_frame, text="• Python 3.7+\n• Windows 10+ or Linux\n• 4GB RAM\n• Network access",
                 font=("Arial", 9), justify="left").pack(padx=10, pady=10)
+        
+        return page
     
-    def show_installation_type(self):
-        tk.Label(self.content_frame, text="Choose Installation Type", 
+    def build_installation_type(self):
+        page = tk.Frame(self.content_frame, bg="#ffffff")
+        
+        tk.Label(page, text="Choose Installation Type", 
                 font=("Arial", 16, "bold"), bg="#ffffff").pack(pady=(0, 30))
         
         # Server option
-        server_frame = tk.LabelFrame(self.content_frame, text="Server Installation", 
+        server_frame = tk.LabelFrame(page, text="Server Installation", 
                                     font=("Arial", 12, "bold"), padx=20, pady=15)
         server_frame.pack(fill="x", pady=10)
         
@@ -151,7 +217,7 @@ class RenderFarmInstaller:
                 justify="left", fg="#666", bg="#ffffff").pack(anchor="w", pady=(5, 0))
         
         # Worker option
-        worker_frame = tk.LabelFrame(self.content_frame, text="Worker Installation", 
+        worker_frame = tk.LabelFrame(page, text="Worker Installation", 
                                     font=("Arial", 12, "bold"), padx=20, pady=15)
         worker_frame.pack(fill="x", pady=10)
         
@@ -161,13 +227,17 @@ class RenderFarmInstaller:
         
         tk.Label(worker_frame, text="• Process render jobs\n• Auto-connect to server\n• High performance",
                 justify="left", fg="#666", bg="#ffffff").pack(anchor="w", pady=(5, 0))
+        
+        return page
     
-    def show_configuration(self):
-        tk.Label(self.content_frame, text="Configuration", 
+    def build_configuration(self):
+        page = tk.Frame(self.content_frame, bg="#ffffff")
+        
+        tk.Label(page, text="Configuration", 
                 font=("Arial", 16, "bold"), bg="#ffffff").pack(pady=(0, 20))
         
         # Installation path
-        path_frame = tk.Frame(self.content_frame, bg="#ffffff")
+        path_frame = tk.Frame(page, bg="#ffffff")
         path_frame.pack(fill="x", pady=10)
         
         tk.Label(path_frame, text="Installation Directory:", 
@@ -184,7 +254,7 @@ class RenderFarmInstaller:
                  width=8).pack(side="right", padx=(10, 0))
         
         # Options
-        options_frame = tk.Frame(self.content_frame, bg="#ffffff")
+        options_frame = tk.Frame(page, bg="#ffffff")
         options_frame.pack(fill="x", pady=20)
         
         tk.Checkbutton(options_frame, text="Create desktop shortcuts", 
@@ -193,55 +263,100 @@ class RenderFarmInstaller:
         tk.Checkbutton(options_frame, text="Start service automatically", 
                       variable=self.start_service, bg="#ffffff").pack(anchor="w")
         
-        # Worker-specific config
+        self.server_frame = tk.LabelFrame(page, text="Server Connection", 
+                                         font=("Arial", 10, "bold"))
+        
+        server_row = tk.Frame(self.server_frame, bg="#ffffff")
+        server_row.pack(fill="x", padx=10, pady=10)
+        
+        tk.Label(server_row, text="Server IP:", bg="#ffffff").pack(side="left")
+        tk.Entry(server_row, textvariable=self.server_ip, width=15).pack(side="left", padx=(10, 20))
+        
+        tk.Label(server_row, text="Port:", bg="#ffffff").pack(side="left")
+        tk.Entry(server_row, textvariable=self.server_port, width=8).pack(side="left", padx=(10, 0))
+        
+        self.install_type.trace_add("write", self.update_server_frame)
+        self.update_server_frame()
+        
+        return page
+    
+    def update_server_frame(self, *args):
         if self.install_type.get() == "worker":
-            server_frame = tk.LabelFrame(self.content_frame, text="Server Connection", 
-                                        font=("Arial", 10, "bold"))
-            server_frame.pack(fill="x", pady=20)
-            
-            server_row = tk.Frame(server_frame, bg="#ffffff")
-            server_row.pack(fill="x", padx=10, pady=10)
-            
-            tk.Label(server_row, text="Server IP:", bg="#ffffff").pack(side="left")
-            tk.Entry(server_row, textvariable=self.server_ip, width=15).pack(side="left", padx=(10, 20))
-            
-            tk.Label(server_row, text="Port:", bg="#ffffff").pack(side="left")
-            tk.Entry(server_row, textvariable=self.server_port, width=8).pack(side="left", padx=(10, 0))
+            self.server_frame.pack(fill="x", pady=20)
+        else:
+            self.server_frame.pack_forget()
     
-    def show_installation(self):
-        tk.Label(self.content_frame, text="Installing...", 
+    def build_installation(self):
+        page = tk.Frame(self.content_frame, bg="#ffffff")
+        
+        tk.Label(page, text="Installing...", 
                 font=("Arial", 16, "bold"), bg="#ffffff").pack(pady=(0, 20))
         
-        # Progress bar
-        self.progress = ttk.Progressbar(self.content_frame, mode='determinate', length=400)
+        style = ttk.Style(self.root)
+        style.theme_use("clam")
+        style.configure("Flat.Horizontal.TProgressbar", troughcolor="#eeeeee",
+                        background="#0066cc", thickness=12)
+        self.progress = ttk.Progressbar(page, mode='determinate', length=400,
+                                        style="Flat.Horizontal.TProgressbar")
         self.progress.pack(pady=20)
         
         # Status label
-        self.status_label = tk.Label(self.content_frame, text="Starting installation...", 
+        self.status_label = tk.Label(page, text="Starting installation...", 
                                     font=("Arial", 10), bg="#ffffff")
         self.status_label.pack(pady=10)
         
         # Log area
-        log_frame = tk.Frame(self.content_frame, bg="#ffffff")
+        log_frame = tk.Frame(page, bg="#ffffff")
         log_frame.pack(fill="both", expand=True, pady=20)
         
-        self.log_text = tk.Text(log_frame, height=10, font=("Courier", 9))
+        self.log_text = tk.Text(log_frame, height=10, font=("Courier", 9), state="disabled")
+        self.log_text.tag_configure("entry", font=("Courier", 9))
         scrollbar = tk.Scrollbar(log_frame, orient="vertical", command=self.log_text.yview)
         self.log_text.configure(yscrollcommand=scrollbar.set)
         
         self.log_text.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
-        # Start installation
-        threading.Thread(target=self.run_installation, daemon=True).start()
+        return page
     
-    def show_complete(self):
-        tk.Label(self.content_frame, text="Installation Complete!", 
+    def build_complete(self):
+        page = tk.Frame(self.content_frame, bg="#ffffff")
+        
+        tk.Label(page, text="Installation Complete!", 
                 font=("Arial", 18, "bold"), fg="#28a745", bg="#ffffff").pack(pady=(0, 20))
         
-        install_path = Path(self.install_path.get())
+        self.complete_message = tk.Text(page, wrap="word", font=("Arial", 12), bg="#ffffff",
+                                        borderwidth=0, highlightthickness=0, state="disabled")
+        self.complete_message.tag_configure("center", justify="center")
+        self.complete_message.pack(fill="x", pady=(0, 30))
         
-        if self.install_type.get() == "server":
+        # Button frame - centered and larger
+        button_frame = tk.Frame(page, bg="#ffffff")
+        button_frame.pack(pady=30)
+        
+        # Launch button - larger and more prominent
+        self.launch_button = tk.Button(button_frame, 
+                                      command=self.launch_app, font=("Arial", 12, "bold"),
+                                      bg="#28a745", fg="white", width=18, height=3)
+        
+        # Finish button - always visible and prominent
+        self.finish_button = tk.Button(button_frame, text="Finish", 
+                                      command=self.root.quit, font=("Arial", 12, "bold"),
+                                      bg="#0066cc", fg="white", width=18, height=2)
+        self.finish_button.pack(pady=(0, 10))
+        
+        # Open folder button - smaller, less prominent
+        tk.Button(button_frame, text="📁 Open Install Folder", 
+                 command=self.open_install_folder, font=("Arial", 10),
+                 bg="#6c757d", fg="white", width=18, height=1).pack()
+        
+        return page
+    
+    def refresh_complete(self):
+        install_path = self.install_dir
+        
+        is_server = self.install_type.get() == "server"
+        if is_server:
             message = f"""Server Ready!
 
 Installed to: {install_path}
@@ -251,6 +366,7 @@ Click "Launch Server" to start immediately."""
         else:
             if self.start_service.get():
                 # Check if service was actually installed by looking at the log
+                self._flush_log()
                 log_content = self.log_text.get("1.0", "end-1c")
                 if "Service started successfully" in log_content:
                     message = f""" Worker Service Running!
@@ -275,29 +391,17 @@ Server: {self.server_ip.get()}:{self.server_port.get()}
 
 Click "Launch Worker" to start processing jobs."""
         
-        tk.Label(self.content_frame, text=message, 
-                font=("Arial", 12), justify="center", bg="#ffffff").pack(pady=(0, 30))
-        
-        # Button frame - centered and larger
-        button_frame = tk.Frame(self.content_frame, bg="#ffffff")
-        button_frame.pack(pady=30)
+        self.complete_message.config(state="normal", height=message.count("\n") + 2)
+        self.complete_message.delete("1.0", tk.END)
+        self.complete_message.insert("1.0", message, "center")
+        self.complete_message.config(state="disabled")
         
-        # Launch button - larger and more prominent
-        if self.install_type.get() == "server" or not self.start_service.get():
-            launch_text = "Launch Server" if self.install_type.get() == "server" else "Launch Worker"
-            tk.Button(button_frame, text=launch_text, 
-                     command=self.launch_app, font=("Arial", 12, "bold"),
-                     bg="#28a745", fg="white", width=18, height=3).pack(pady=(0, 15))
-        
-        # Finish button - always visible and prominent
-        tk.Button(button_frame, text="Finish", 
-                 command=self.root.quit, font=("Arial", 12, "bold"),
-                 bg="#0066cc", fg="white", width=18, height=2).pack(pady=(0, 10))
-        
-        # Open folder button - smaller, less prominent
-        tk.Button(button_frame, text="📁 Open Install Folder", 
-                 command=self.open_install_folder, font=("Arial", 10),
-                 bg="#6c757d", fg="white", width=18, height=1).pack()
+        if is_server or not self.start_service.get():
+            launch_text = "Launch Server" if is_server else "Launch Worker"
+            self.launch_button.config(text=launch_text)
+            self.launch_button.pack(pady=(0, 15), before=self.finish_button)
+        else:
+            self.launch_button.pack_forget()
     
     def install_worker_service(self, install_path):
         """Install worker as Windows service"""
@@ -317,20 +421,17 @@ Click "Launch Worker" to start processing jobs."""
                 self.log_message(" Could not check admin privileges")
             
             # Check if service already exists and remove it
-            check_cmd = f'sc query {service_name}'
-            check_result = subprocess.run(check_cmd, shell=True, capture_output=True, text=True)
+            check_result = subprocess.run(["sc", "query", service_name], capture_output=True, text=True)
             
             if check_result.returncode == 0:
                 self.log_message(f" Found existing {service_name} service - removing it")
                 
                 # Stop the service first
-                stop_cmd = f'sc stop {service_name}'
-                subprocess.run(stop_cmd, shell=True, capture_output=True, text=True)
+                subprocess.run(["sc", "stop", service_name], capture_output=True, text=True)
                 self.log_message(" Stopped existing service")
                 
                 # Delete the service
-                delete_cmd = f'sc delete {service_name}'
-                delete_result = subprocess.run(delete_cmd, shell=True, capture_output=True, text=True)
+                delete_result = subprocess.run(["sc", "delete", service_name], capture_output=True, text=True)
                 
                 if delete_result.returncode == 0:
                     self.log_message(" Removed existing service")
@@ -343,29 +444,28 @@ Click "Launch Worker" to start processing jobs."""
             # Create service script
             service_script = f'''@echo off
 cd /d "{install_path}"
-python worker_node.py --server http://{self.server_ip.get()}:{self.server_port.get()}'''
+python worker_node.py --server http://{self.settings['server_ip']}:{self.settings['server_port']}'''
             
             service_bat = install_path / "worker_service.bat"
-            with open(service_bat, 'w') as f:
-                f.write(service_script)
+            self._write_text(service_bat, service_script)
             
             self.log_message(" Created service script")
             
             # Create Windows service with batch file wrapper  
-            create_cmd = f'sc create {service_name} binPath= "\\"{service_bat}\\"" start= auto DisplayName= "Render Farm Worker" depend= Tcpip'
+            create_cmd = ["sc", "create", service_name, "binPath=", f'"{service_bat}"', "start=", "auto",
+                          "DisplayName=", "Render Farm Worker", "depend=", "Tcpip"]
             
-            result = subprocess.run(create_cmd, shell=True, capture_output=True, text=True)
+            result = subprocess.run(create_cmd, capture_output=True, text=True)
             
             if result.returncode == 0:
                 self.log_message(" Windows service created successfully")
                 
                 # Set service description
-                desc_cmd = f'sc description {service_name} "Render Farm Worker - Distributed rendering node"'
-                subprocess.run(desc_cmd, shell=True, capture_output=True, text=True)
+                subprocess.run(["sc", "description", service_name, "Render Farm Worker - Distributed rendering node"],
+                               capture_output=True, text=True)
                 
                 # Start the service
-                start_cmd = f"sc start {service_name}"
-                start_result = subprocess.run(start_cmd, shell=True, capture_output=True, text=True)
+                start_result = subprocess.run(["sc", "start", service_name], capture_output=True, text=True)
                 
                 if start_result.returncode == 0:
                     self.log_message(" Service started successfully - Worker is now running!")
@@ -388,10 +488,10 @@ python worker_node.py --server http://{self.server_ip.get()}:{self.server_port.g
             self.log_message("  Worker installed for manual start only")
     
     def open_install_folder(self):
-        install_path = Path(self.install_path.get())
-        if platform.system() == "Windows":
+        install_path = self.install_dir
+        if PLATFORM_SYSTEM == "Windows":
             os.startfile(install_path)
-        elif platform.system() == "Darwin":
+        elif PLATFORM_SYSTEM == "Darwin":
             subprocess.run(["open", str(install_path)])
         else:
             subprocess.run(["xdg-open", str(install_path)])
@@ -424,8 +524,8 @@ python worker_node.py --server http://{self.server_ip.get()}:{self.server_port.g
             self.show_step()
     
     def update_buttons(self):
-        # Back button
-        self.back_button.config(state="normal" if self.current_step > 0 else "disabled")
+        installing = self.installation_started and not self.installation_complete
+        self.back_button.config(state="normal" if self.current_step > 0 and not installing else "disabled")
         
         # Next button
         if self.current_step == 4:
@@ -439,9 +539,21 @@ python worker_node.py --server http://{self.server_ip.get()}:{self.server_port.g
             self.next_button.config(text="Next", state="normal", bg="#0066cc")
     
     def validate_config(self):
-        if not self.install_path.get().strip():
+        path = self.install_path.get().strip()
+        if not path:
             messagebox.showerror("Error", "Please select an installation directory")
             return False
+        if not PATH_RE.match(path):
+            messagebox.showerror("Error", "Please enter an absolute installation directory")
+            return False
+        self.install_dir = Path(path)
+        self.settings = {
+            "install_type": self.install_type.get(),
+            "server_ip": self.server_ip.get(),
+            "server_port": self.server_port.get(),
+            "create_shortcuts": self.create_shortcuts.get(),
+            "start_service": self.start_service.get(),
+        }
         return True
     
     def run_installation(self):
@@ -450,7 +562,7 @@ python worker_node.py --server http://{self.server_ip.get()}:{self.server_port.g
             self.update_progress(5, "Validating installation path...")
             
             # Create install directory
-            install_path = Path(self.install_path.get())
+            install_path = self.install_dir
             self.log_message(f"Installing to: {install_path}")
             
             try:
@@ -489,7 +601,8 @@ python worker_node.py --server http://{self.server_ip.get()}:{self.server_port.g
                 "worker_deployment_manager.py"
             ]
             
-            if self.install_type.get() == "server":
+            is_worker = self.settings["install_type"] == "worker"
+            if not is_worker:
                 files_to_copy = core_files + server_files
                 self.log_message("Installing SERVER components...")
             else:
@@ -501,24 +614,36 @@ python worker_node.py --server http://{self.server_ip.get()}:{self.server_port.g
             copied_files = 0
             missing_files = []
             
-            for i, file in enumerate(files_to_copy):
-                progress = 25 + (i * 40 // len(files_to_copy))
-                self.update_progress(progress, f"Copying {file}...")
-                
-                src = source_path / file
-                dst = install_path / file
+            for parent in {(install_path / file).parent for file in files_to_copy} - {install_path}:
+                parent.mkdir(parents=True, exist_ok=True)
+            
+            with os.scandir(source_path) as entries:
+                present = {entry.name for entry in entries if entry.is_file()}
+            
+            src_base = str(source_path)
+            dst_base = str(install_path)
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = {}
+                for file in files_to_copy:
+                    if file in present:
+                        src = os.path.join(src_base, file)
+                        dst = os.path.join(dst_base, file)
+                        futures[executor.submit(shutil.copyfile, src, dst)] = file
+                    else:
+                        self.log_message(f"✗ Missing source file: {file}")
+                        missing_files.append(f"{file} (not found)")
                 
-                if src.exists():
+                for i, future in enumerate(as_completed(futures), 1):
+                    file = futures[future]
+                    progress = 25 + (i * 40 // len(files_to_copy))
+                    self.update_progress(progress, f"Copied {file}")
                     try:
-                        shutil.copy2(src, dst)
+                        future.result()
                         self.log_message(f" Copied {file}")
                         copied_files += 1
                     except Exception as e:
                         self.log_message(f"✗ Failed to copy {file}: {e}")
                         missing_files.append(f"{file} (copy error)")
-                else:
-                    self.log_message(f"✗ Missing source file: {file}")
-                    missing_files.append(f"{file} (not found)")
             
             self.log_message(f"Copied {copied_files} files successfully")
             if missing_files:
@@ -532,15 +657,16 @@ python worker_node.py --server http://{self.server_ip.get()}:{self.server_port.g
             else:
                 # Try to install Python dependencies (development mode only)
                 try:
-                    result = subprocess.run([
-                        sys.executable, "-m", "pip", "install", "-r", 
-                        str(install_path / "requirements.txt")
-                    ], capture_output=True, text=True, timeout=60)
-                    
-                    if result.returncode == 0:
-                        self.log_message(" Python dependencies installed")
+                    missing = _missing_requirements(install_path / "requirements.txt")
+                    if not missing:
+                        self.log_message(" All dependencies already installed")
                     else:
-                        self.log_message(f" Dependency installation warning: {result.stderr}")
+                        returncode = self.run_pip_install(*missing)
+                        
+                        if returncode == 0:
+                            self.log_message(" Python dependencies installed")
+                        else:
+                            self.log_message(f" Dependency installation warning: pip exited with code {returncode}")
                 except Exception as e:
                     self.log_message(f" Could not install dependencies: {e}")
             
@@ -552,11 +678,11 @@ python worker_node.py --server http://{self.server_ip.get()}:{self.server_port.g
             self.update_progress(90, "Creating shortcuts and launchers...")
             
             # Create shortcuts
-            if self.create_shortcuts.get():
+            if self.settings["create_shortcuts"]:
                 self.create_shortcuts_func(install_path)
             
             # Create Windows service for worker if requested
-            if self.install_type.get() == "worker" and self.start_service.get():
+            if is_worker and self.settings["start_service"]:
                 self.update_progress(95, "Installing Windows service...")
                 self.install_worker_service(install_path)
             
@@ -565,7 +691,7 @@ python worker_node.py --server http://{self.server_ip.get()}:{self.server_port.g
             self.log_message(" INSTALLATION COMPLETED SUCCESSFULLY")
             self.log_message(f" Files installed to: {install_path}")
             
-            if self.install_type.get() == "server":
+            if not is_worker:
                 self.log_message(" Server components ready")
                 self.log_message(" Launch with Start_RenderFarm.bat")
             else:
@@ -575,57 +701,170 @@ python worker_node.py --server http://{self.server_ip.get()}:{self.server_port.g
             self.log_message("=" * 50)
             
             self.installation_complete = True
-            self.update_buttons()
+            self.root.after(0, self.update_buttons)
             
         except Exception as e:
             error_msg = f"Installation failed: {str(e)}"
             self.log_message(f"ERROR: {error_msg}")
             self.update_progress(0, "Installation failed!")
-            messagebox.showerror("Installation Error", error_msg)
+            self.root.after(0, self.installation_failed, error_msg)
+    
+    def installation_failed(self, error_msg):
+        self.installation_started = False
+        self.update_buttons()
+        messagebox.showerror("Installation Error", error_msg)
+    
+    def run_pip_install(self, *specs, timeout=60):
+        """Run pip on the given requirement specs, streaming its output into the log"""
+        proc = subprocess.Popen([
+            sys.executable, "-m", "pip", "install", "--no-input", *specs
+        ], stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+           text=True, bufsize=1)
+        
+        drained = threading.Event()
+        
+        if PLATFORM_SYSTEM == "Windows":
+            lines = queue.Queue()
+            
+            def read_output():
+                for line in proc.stdout:
+                    lines.put(line.rstrip())
+                lines.put(None)
+            
+            threading.Thread(target=read_output, daemon=True).start()
+            self.root.after(50, self._drain_pip_queue, lines, drained)
+        else:
+            self.root.after(0, self._watch_pip_output, proc, drained)
+        
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            drained.wait()
+            raise
+        drained.wait()
+        proc.stdout.close()
+        return proc.returncode
+    
+    def _watch_pip_output(self, proc, drained):
+        """Register pip's stdout with the Tk event loop"""
+        fd = proc.stdout.fileno()
+        partial = bytearray()
+        
+        def on_readable(fd, mask):
+            data = os.read(fd, 65536)
+            if data:
+                partial.extend(data)
+                *complete, rest = partial.split(b"\n")
+                partial[:] = rest
+            else:
+                self.root.tk.deletefilehandler(fd)
+                complete = [bytes(partial)] if partial else []
+            self._append_pip_lines(line.decode(errors="replace").rstrip() for line in complete)
+            if not data:
+                drained.set()
+        
+        self.root.tk.createfilehandler(fd, tk.READABLE, on_readable)
+    
+    def _append_pip_lines(self, lines):
+        """Insert pip output lines into the log in one go"""
+        self._flush_log()
+        chunk = "".join(f"  {line}\n" for line in lines)
+        if chunk:
+            self._append_log(chunk)
+    
+    def _drain_pip_queue(self, lines, drained):
+        """Move pip output into the log on the Tk main thread"""
+        chunk = []
+        done = False
+        while True:
+            try:
+                line = lines.get_nowait()
+            except queue.Empty:
+                break
+            if line is None:
+                done = True
+                break
+            chunk.append(line)
+        
+        self._append_pip_lines(chunk)
+        if done:
+            drained.set()
+        else:
+            self.root.after(50, self._drain_pip_queue, lines, drained)
     
     def update_progress(self, value, status):
+        self._progress_state = (value, status)
+        if not self._progress_pending:
+            self._progress_pending = True
+            self.root.after_idle(self._progress_on_ui)
+    
+    def _progress_on_ui(self):
+        self._progress_pending = False
+        value, status = self._progress_state
         self.progress['value'] = value
         self.status_label.config(text=status)
-        self.root.update()
     
     def log_message(self, message):
-        self.log_text.insert(tk.END, f"{message}\n")
+        with self._log_lock:
+            self._log_queue.append(message)
+            if self._log_flush_pending:
+                return
+            self._log_flush_pending = True
+        self.root.after(100, self._flush_log)
+    
+    def _flush_log(self):
+        with self._log_lock:
+            lines = list(self._log_queue)
+            self._log_queue.clear()
+            self._log_flush_pending = False
+        if lines:
+            self._append_log("\n".join(lines) + "\n")
+    
+    def _append_log(self, text):
+        self.log_text.config(state="normal")
+        self.log_text.insert(tk.END, text, "entry")
+        self.log_text.config(state="disabled")
         self.log_text.see(tk.END)
-        self.root.update()
     
     def create_config(self, install_path):
-        if self.install_type.get() == "worker":
+        if self.settings["install_type"] == "worker":
             # Make sure server URL is properly formatted
-            server_url = self.server_ip.get()
+            server_url = self.settings["server_ip"]
             # Add http:// prefix if not already present
             if not server_url.startswith(("http://", "https://")):
                 server_url = f"http://{server_url}"
             
             # Make sure the port is added to the URL
             if ":" not in server_url.split("/")[-1]:
-                server_url = f"{server_url}:{self.server_port.get()}"
+                server_url = f"{server_url}:{self.settings['server_port']}"
                 
             config = {
                 "server_url": server_url,
-                "worker_id": f"worker_{platform.node()}",
+                "worker_id": f"worker_{PLATFORM_NODE}",
                 "auto_start": True
             }
             
             self.log_message(f"Creating worker config with server URL: {server_url}")
-            with open(install_path / "worker_config.json", 'w') as f:
-                json.dump(config, f, indent=2)
+            self._write_text(install_path / "worker_config.json", json.dumps(config, indent=2))
         else:
             config = {
-                "port": int(self.server_port.get()),
+                "port": int(self.settings["server_port"]),
                 "host": "0.0.0.0",
                 "database_path": str(install_path / "render_farm.db")
             }
-            with open(install_path / "server_config.json", 'w') as f:
-                json.dump(config, f, indent=2)
+            self._write_text(install_path / "server_config.json", json.dumps(config, indent=2))
                 
+    def _write_text(self, path, content):
+        """Write a small generated file with one encode and one write"""
+        Path(path).write_bytes(content.replace("\n", os.linesep).encode("utf-8"))
+    
     def create_shortcuts_func(self, install_path):
-        if platform.system() == "Windows":
-            if self.install_type.get() == "server":
+        is_server = self.settings["install_type"] == "server"
+        if PLATFORM_SYSTEM == "Windows":
+            desktop = PUBLIC_DESKTOP if PUBLIC_DESKTOP.exists() else None
+            if is_server:
                 script_content = f'''@echo off
 title Render Farm Server
 cd /d "{install_path}"
@@ -640,31 +879,28 @@ echo Server API: http://localhost:8080
 echo Close this window when done
 pause'''
                 launcher_path = install_path / "Start_RenderFarm.bat"
-                with open(launcher_path, 'w') as f:
-                    f.write(script_content)
+                self._write_text(launcher_path, script_content)
                 self.log_message(f"Created launcher: {launcher_path}")
                 
                 # Try to create desktop shortcut
                 try:
-                    desktop = Path("C:/Users/Public/Desktop")
-                    if desktop.exists():
+                    if desktop is not None:
                         desktop_shortcut = desktop / "Render Farm Server.bat"
-                        with open(desktop_shortcut, 'w') as f:
-                            f.write(script_content)
+                        self._write_text(desktop_shortcut, script_content)
                         self.log_message(f" Created desktop shortcut: {desktop_shortcut}")
                 except Exception as e:
                     self.log_message(f" Could not create desktop shortcut: {e}")
                     
             else:
                 # Make sure server URL is properly formatted
-                server_url = self.server_ip.get()
+                server_url = self.settings["server_ip"]
                 # Add http:// prefix if not already present
                 if not server_url.startswith(("http://", "https://")):
                     server_url = f"http://{server_url}"
                 
                 # Make sure the port is added to the URL
                 if ":" not in server_url.split("/")[-1]:
-                    server_url = f"{server_url}:{self.server_port.get()}"
+                    server_url = f"{server_url}:{self.settings['server_port']}"
                 
                 # Create two versions: visible and background
                 # Visible version (for testing/debugging)
@@ -682,38 +918,32 @@ start /min "" python worker_node.py --server {server_url}'''
                 
                 # Create both launchers
                 launcher_path = install_path / "Start_Worker.bat"
-                with open(launcher_path, 'w') as f:
-                    f.write(script_content)
+                self._write_text(launcher_path, script_content)
                 self.log_message(f" Created launcher: {launcher_path}")
                 
                 # Create background launcher
                 background_path = install_path / "Start_Worker_Background.bat"
-                with open(background_path, 'w') as f:
-                    f.write(background_script)
+                self._write_text(background_path, background_script)
                 self.log_message(f" Created background launcher: {background_path}")
                 
                 # Try to create desktop shortcuts
                 try:
-                    desktop = Path("C:/Users/Public/Desktop")
-                    if desktop.exists():
+                    if desktop is not None:
                         # Create background shortcut (main one)
                         desktop_shortcut = desktop / "Render Farm Worker (Background).bat"
-                        with open(desktop_shortcut, 'w') as f:
-                            f.write(background_script)
+                        self._write_text(desktop_shortcut, background_script)
                         self.log_message(f" Created background desktop shortcut: {desktop_shortcut}")
                         
                         # Create visible shortcut (for debugging)
                         desktop_debug = desktop / "Render Farm Worker (Debug).bat" 
-                        with open(desktop_debug, 'w') as f:
-                            f.write(script_content)
+                        self._write_text(desktop_debug, script_content)
                         self.log_message(f" Created debug desktop shortcut: {desktop_debug}")
                         
                         # Add to Windows Startup folder for auto-start on boot
                         startup_folder = Path(os.environ["APPDATA"]) / "Microsoft" / "Windows" / "Start Menu" / "Programs" / "Startup"
                         if startup_folder.exists():
                             startup_shortcut = startup_folder / "Render Farm Worker.bat"
-                            with open(startup_shortcut, 'w') as f:
-                                f.write(background_script)
+                            self._write_text(startup_shortcut, background_script)
                             self.log_message(f" Added to Windows Startup: {startup_shortcut}")
                             self.log_message(" Worker will start automatically on system boot!")
                         else:
@@ -722,13 +952,12 @@ start /min "" python worker_node.py --server {server_url}'''
                     self.log_message(f" Could not create desktop shortcut: {e}")
         else:
             # Linux shortcuts
-            if self.install_type.get() == "server":
+            if is_server:
                 script_content = f'''#!/bin/bash
 cd "{install_path}"
 python3 main_app.py'''
                 launcher_path = install_path / "start_server.sh"
-                with open(launcher_path, 'w') as f:
-                    f.write(script_content)
+                self._write_text(launcher_path, script_content)
                 launcher_path.chmod(0o755)
                 self.log_message(f" Created launcher: {launcher_path}")
             else:
@@ -736,20 +965,19 @@ python3 main_app.py'''
 cd "{install_path}"
 python3 worker_node.py'''
                 launcher_path = install_path / "start_worker.sh"
-                with open(launcher_path, 'w') as f:
-                    f.write(script_content)
+                self._write_text(launcher_path, script_content)
                 launcher_path.chmod(0o755)
                 self.log_message(f" Created launcher: {launcher_path}")
     
     def launch_app(self):
-        install_path = Path(self.install_path.get())
+        install_path = self.install_dir
         if self.install_type.get() == "server":
             script = install_path / "Start_RenderFarm.bat"
         else:
             script = install_path / "Start_Worker.bat"
         
         if script.exists():
-            subprocess.Popen([str(script)], shell=True)
+            subprocess.Popen([str(script)])
     
     def run(self):
         self.root.mainloop()
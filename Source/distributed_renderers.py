@@ -28,12 +28,14 @@ class DistributedRenderer(ABC):
         
         return sorted(list(set(frames)))  # Remove duplicates and sort
     
-    def create_batches(self, frames, batch_size):
-        """Split frames into batches"""
+    def create_batches(self, frames, batch_size, allow_gaps=False):
+        """Split frames into batches, optionally as several spans per batch"""
         batches = []
         for i in range(0, len(frames), batch_size):
             batch_frames = frames[i:i + batch_size]
-            if len(batch_frames) == 1:
+            if allow_gaps:
+                frame_range = self.format_spans(batch_frames)
+            elif len(batch_frames) == 1:
                 frame_range = str(batch_frames[0])
             else:
                 frame_range = f"{batch_frames[0]}-{batch_frames[-1]}"
@@ -41,6 +43,20 @@ class DistributedRenderer(ABC):
         
         return batches
     
+    def format_spans(self, frames):
+        """Format sorted frames as comma separated contiguous spans"""
+        spans = []
+        start = prev = frames[0]
+        for frame in frames[1:] + [None]:
+            if frame is not None and frame == prev + 1:
+                prev = frame
+                continue
+            spans.append(str(start) if start == prev else f"{start}-{prev}")
+            if frame is not None:
+                start = prev = frame
+        
+        return ','.join(spans)
+    
     def create_sub_jobs(self, job_id, batches):
         """Create sub-jobs in the database"""
         conn = sqlite3.connect(self.queue_manager.db_path)
@@ -68,7 +84,7 @@ class DistributedNukeRenderer(DistributedRenderer):
         print(f"Total frames: {len(frames)}, Batch size: {batch_size}")
         
         # Create batches
-        batches = self.create_batches(frames, batch_size)
+        batches = self.create_batches(frames, batch_size, allow_gaps=True)
         print(f"Created {len(batches)} batches: {batches}")
         
         # Create sub-jobs
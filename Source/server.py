@@ -8,6 +8,11 @@ import sys
 import signal
 from job_queue_manager import JobQueueManager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class RenderFarmAPIHandler(BaseHTTPRequestHandler):
     # Class variable to share queue manager across all handler instances
     queue_manager = None
@@ -96,8 +101,8 @@ class RenderFarmAPIHandler(BaseHTTPRequestHandler):
         if content_length > 0:
             post_data = self.rfile.read(content_length)
             try:
-                data = json.loads(post_data.decode('utf-8'))
-            except json.JSONDecodeError:
+                data = orjson.loads(post_data) if orjson else json.loads(post_data.decode('utf-8'))
+            except (ValueError, UnicodeDecodeError):
                 self.send_error_response(400, "Invalid JSON in request body")
                 return
         else:
@@ -126,6 +131,7 @@ class RenderFarmAPIHandler(BaseHTTPRequestHandler):
             try:
                 worker_id = data['worker_id']
                 system_metrics = data.get('system_metrics', {})
+                metrics_samples = data.get('metrics_samples', [])
                 current_jobs = data.get('current_jobs', [])
                 worker_status = data.get('status', 'unknown')
                 
@@ -143,7 +149,9 @@ class RenderFarmAPIHandler(BaseHTTPRequestHandler):
                     cpu = system_metrics.get('cpu_percent', 0)
                     memory = system_metrics.get('memory_percent', 0)
                     jobs_count = len(current_jobs)
-                    print(f"📊 Worker {worker_id}: CPU {cpu:.1f}%, RAM {memory:.1f}%, Jobs: {jobs_count}")
+                    peak_cpu = max((sample.get('cpu_percent', 0) for sample in metrics_samples), default=cpu)
+                    print(f"📊 Worker {worker_id}: CPU {cpu:.1f}% (peak {peak_cpu:.1f}% over {len(metrics_samples)} samples), "
+                          f"RAM {memory:.1f}%, Jobs: {jobs_count}")
                 
                 response = {
                     'status': 'ok',
@@ -199,8 +207,10 @@ class RenderFarmAPIHandler(BaseHTTPRequestHandler):
         self.send_cors_headers()
         self.end_headers()
         if data is not None:
-            response_json = json.dumps(data, indent=2)
-            self.wfile.write(response_json.encode('utf-8'))
+            if orjson:
+                self.wfile.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                self.wfile.write(json.dumps(data, indent=2).encode('utf-8'))
     
     def send_html_response(self, html, status_code=200):
         """Send HTML response"""
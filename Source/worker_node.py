@@ -1,46 +1,221 @@
 import os
+import re
 import sys
 import time
 import json
+import mmap
 import socket
+import select
 import requests
 import subprocess
 import threading
 import argparse
 import platform
 import glob
-import psutil
+import shutil
 import hashlib
 import logging
 import asyncio
 import aiofiles
-import weakref
 from datetime import datetime
 from pathlib import Path
 from multiprocessing import shared_memory
-from collections import OrderedDict
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
+from urllib3.util.retry import Retry
+
+try:
+    import psutil
+except ImportError:
+    sys.exit("psutil not installed. Run: pip install psutil")
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+class RateLimitingFilter(logging.Filter):
+    """Token bucket per message template for ERROR and above"""
+    
+    def __init__(self, rate=1.0, burst=5):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.buckets = {}
+        self.lock = threading.Lock()
+    
+    def filter(self, record):
+        if record.levelno < logging.ERROR:
+            return True
+        now = time.monotonic()
+        with self.lock:
+            tokens, last = self.buckets.get(record.msg, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - last) * self.rate)
+            allowed = tokens >= 1
+            self.buckets[record.msg] = (tokens - 1 if allowed else tokens, now)
+        return allowed
+
+logger.addFilter(RateLimitingFilter())
+
+MAX_PEAK_ENTRIES = 1024
+
+_METRICS_ERROR_TEMPLATE = {'cpu_percent': 0, 'memory_percent': 0, 'disk_free_gb': 0}
+
+_FRAME_RE = re.compile(r'(\d+)\.(?:exr|png|jpe?g|tiff?|dpx)$', re.IGNORECASE)
+
+_WRITE_HEADER_RE = re.compile(rb'\bWrite\s*\{')
+_WRITE_FILE_RE = re.compile(rb'\bfile\s+"([^"]+)"')
+
+DiskUsage = namedtuple('DiskUsage', 'total free percent')
+
+def disk_usage(path):
+    """Total and available bytes of the volume holding path, from one statvfs call"""
+    if hasattr(os, 'statvfs'):
+        st = os.statvfs(path)
+        total = st.f_blocks * st.f_frsize
+        free = st.f_bavail * st.f_frsize
+    else:
+        total, _, free = shutil.disk_usage(path)
+    percent = 100 - 100 * free / total if total else 0
+    return DiskUsage(total, free, percent)
+
+def find_block_end(buffer, pos):
+    """Return the offset just past the brace closing a block opened before pos"""
+    depth = 1
+    while depth:
+        close = buffer.find(b'}', pos)
+        if close < 0:
+            return len(buffer)
+        opening = buffer.find(b'{', pos, close)
+        if opening >= 0:
+            depth += 1
+            pos = opening + 1
+        else:
+            depth -= 1
+            pos = close + 1
+    return pos
+
+def drain_stream(stream, max_lines=4096):
+    """Read a pipe line by line as it is written, keeping only the latest lines"""
+    tail = deque(maxlen=max_lines)
+    for line in stream:
+        tail.append(line)
+    return ''.join(tail)
+
+def open_pidfd(pid):
+    """Open a pollable pidfd for a child process, or None where unsupported"""
+    if not hasattr(os, 'pidfd_open'):
+        return None
+    try:
+        return os.pidfd_open(pid)
+    except OSError:
+        return None
+
+def deprioritize_current_thread(cpu=None, niceness=5):
+    """Lower the calling thread's priority and optionally pin it to one CPU"""
+    try:
+        if sys.platform.startswith('linux'):
+            tid = threading.get_native_id()
+            os.setpriority(os.PRIO_PROCESS, tid, niceness)
+            if cpu is not None and hasattr(os, 'sched_setaffinity'):
+                os.sched_setaffinity(tid, {cpu})
+        elif platform.system() == 'Windows':
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            thread_priority_below_normal = -1
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), thread_priority_below_normal)
+    except (OSError, AttributeError) as e:
+        logger.debug(f"Could not lower background thread priority: {e}")
+
+class JobSpec:
+    """Frame spans, extra arguments and timeout parsed once per job"""
+    __slots__ = ('frame_range', 'spans', 'start_frame', 'end_frame', 'frame_count',
+                 'frames', 'extra_args', 'timeout')
+    
+    def __init__(self, frame_range, extra_args='', timeout_per_frame=1800):
+        self.frame_range = frame_range
+        self.spans = []
+        for part in frame_range.split(','):
+            if '-' in part:
+                start, end = map(int, part.split('-'))
+            else:
+                start = end = int(part)
+            self.spans.append((start, end))
+        
+        self.start_frame = self.spans[0][0]
+        self.end_frame = self.spans[-1][1]
+        self.frame_count = sum(end - start + 1 for start, end in self.spans)
+        if len(self.spans) == 1:
+            self.frames = range(self.start_frame, self.end_frame + 1)
+        else:
+            self.frames = frozenset(f for start, end in self.spans for f in range(start, end + 1))
+        self.extra_args = extra_args.split() if extra_args else []
+        self.timeout = self.frame_count * timeout_per_frame
+    
+    def nuke_frame_args(self):
+        """One -F argument per span so a batch renders in a single Nuke process"""
+        args = []
+        for start, end in self.spans:
+            args += ['-F', f"{start}-{end}"]
+        return args
+
 class ProductionRenderWorker:
+    __slots__ = (
+        'server_url', 'worker_id', 'hostname', 'ip_address', 'running',
+        'current_jobs', 'config', 'metrics_collector', 'render_history',
+        'asset_cache', 'render_buffer_pool', 'async_file_manager',
+        'memory_job_cache', 'output_locations', 'render_stats', 'temp_dir',
+        'log_dir', 'capabilities', '_peak_memory_cache', '_io_pool', '_render_sem',
+        '_stop_event', '_jobs_done', '_output_pool', '_is_highend',
+        '_poll_busy', '_poll_idle', '_heartbeat_interval', '_http',
+        '_loop', '_async_stop', '_metrics_buf', '_metrics_wake',
+        '_send_pool'
+    )
+    
     def __init__(self, server_url, worker_id=None, config_path="worker_config.json"):
         self.server_url = server_url.rstrip('/')
         self.worker_id = worker_id or f"worker_{socket.gethostname()}"
         self.hostname = socket.gethostname()
         self.ip_address = self.get_local_ip()
         self.running = False
+        self._stop_event = threading.Event()
+        self._loop = None
+        self._async_stop = None
+        self._metrics_wake = None
         self.current_jobs = {}
+        self._jobs_done = threading.Condition()
         self.config = self.load_config(config_path)
         
+        self._http = requests.Session()
+        retries = Retry(total=2, backoff_factor=0.1)
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries)
+        self._http.mount('http://', adapter)
+        self._http.mount('https://', adapter)
+        api_key = self.config.get('api_key')
+        if api_key:
+            self._http.headers['X-API-Key'] = api_key
+        
         # Performance monitoring
-        self.metrics_collector = SystemMetricsCollector()
+        self.metrics_collector = SystemMetricsCollector(
+            collect_network=self.config.get('collect_network', True),
+            slow_ttl=self.config.get('slow_metrics_ttl', 5.0)
+        )
         self.render_history = []
+        self._peak_memory_cache = OrderedDict()
+        self._metrics_buf = deque(maxlen=512)
         
         # Enhanced performance features
         # Aggressive RAM usage for high-end systems
         available_ram_gb = psutil.virtual_memory().total / (1024**3)
+        self._is_highend = available_ram_gb >= 32
+        
+        self._poll_busy = 5 if self._is_highend else 10
+        self._poll_idle = 15 if self._is_highend else 30
+        self._heartbeat_interval = self.config.get('heartbeat_interval', 20 if self._is_highend else 45)
         
         # For 64GB+ systems, use much more RAM for caching
         if available_ram_gb >= 32:
@@ -59,10 +234,20 @@ class ProductionRenderWorker:
             buffer_size_mb = 512
             max_buffers = 8
             
-        self.render_buffer_pool = RenderBufferPool(buffer_size_mb=buffer_size_mb, max_buffers=max_buffers)
+        self.render_buffer_pool = RenderBufferPool(buffer_size_mb=buffer_size_mb, max_buffers=max_buffers,
+                                                   preallocate=self.config.get('max_concurrent_renders', 1))
         self.async_file_manager = AsyncFileManager()
         self.memory_job_cache = {}
         
+        self._render_sem = threading.BoundedSemaphore(self.config.get('max_concurrent_renders', 1))
+        
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=2 * self.config.get('max_concurrent_jobs', 1),
+            thread_name_prefix='render-io'
+        )
+        self._output_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='render-output')
+        self._send_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='metrics-send')
+        
         # Output tracking
         self.output_locations = {}
         self.render_stats = {
@@ -84,6 +269,8 @@ class ProductionRenderWorker:
         
         logger.info(f"Production worker initialized: {self.worker_id}")
         logger.info(f"Hostname: {self.hostname}, IP: {self.ip_address}")
+        logger.info(f"Concurrency: {self.config['max_concurrent_jobs']} jobs, "
+                    f"{self.config['max_concurrent_renders']} concurrent renders")
         logger.info(f"Capabilities: {self.capabilities}")
     
     def load_config(self, config_path):
@@ -96,6 +283,11 @@ class ProductionRenderWorker:
             "timeout_per_frame": 1800,  # 30 minutes per frame
             "temp_directory": "temp_renders",
             "log_directory": "logs",
+            "verbose_render_logs": False,
+            "collect_network": True,
+            "slow_metrics_ttl": 5.0,
+            "metrics_batch_size": 32,
+            "background_cpu": 0,
             "resource_limits": {
                 "max_memory_percent": 85,
                 "max_cpu_percent": 95
@@ -118,12 +310,13 @@ class ProductionRenderWorker:
         
         try:
             if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    user_config = json.load(f)
+                with open(config_path, 'rb') as f:
+                    user_config = orjson.loads(f.read()) if orjson else json.load(f)
                 default_config.update(user_config)
         except Exception as e:
             logger.warning(f"Failed to load config: {e}, using defaults")
         
+        default_config.setdefault('max_concurrent_renders', default_config['max_concurrent_jobs'])
         return default_config
     
     def detect_optimal_concurrency(self):
@@ -161,7 +354,7 @@ class ProductionRenderWorker:
             'hostname': self.hostname,
             'cpu_count': os.cpu_count(),
             'memory_gb': round(psutil.virtual_memory().total / (1024**3), 2),
-            'disk_space_gb': round(psutil.disk_usage('.').free / (1024**3), 2),
+            'disk_space_gb': round(self.metrics_collector.get_disk().free / (1024**3), 2),
             'renderers': self.detect_renderers(),
             'network_speed': self.test_network_speed(),
             'max_concurrent_jobs': self.config.get('max_concurrent_jobs', 1)
@@ -250,7 +443,7 @@ class ProductionRenderWorker:
         """Basic network speed test"""
         try:
             start_time = time.time()
-            response = requests.get(f"{self.server_url}/api/status", timeout=5)
+            response = self._http.get(f"{self.server_url}/api/status", timeout=5)
             latency = (time.time() - start_time) * 1000
             return {"latency_ms": round(latency, 2), "status": "ok"}
         except:
@@ -267,6 +460,12 @@ class ProductionRenderWorker:
         except:
             return "127.0.0.1"
     
+    def post_json(self, endpoint, payload, timeout):
+        """POST a JSON payload, serialized with orjson when available"""
+        data = orjson.dumps(payload) if orjson else json.dumps(payload).encode('utf-8')
+        return self._http.post(f"{self.server_url}{endpoint}", data=data,
+                               headers={'Content-Type': 'application/json'}, timeout=timeout)
+    
     def register_with_server(self):
         """Register with enhanced retry and validation"""
         max_retries = self.config.get('retry_attempts', 3)
@@ -280,27 +479,16 @@ class ProductionRenderWorker:
                     'capabilities': self.capabilities
                 }
                 
-                # Add API key if configured
-                headers = {}
-                api_key = self.config.get('api_key')
-                if api_key:
-                    headers['X-API-Key'] = api_key
-                
-                response = requests.post(
-                    f"{self.server_url}/api/workers/register",
-                    json=payload,
-                    headers=headers,
-                    timeout=15
-                )
+                response = self.post_json("/api/workers/register", payload, timeout=15)
                 
                 if response.status_code == 200:
                     logger.info("Successfully registered with server")
                     return True
                 else:
-                    logger.error(f"Registration failed: HTTP {response.status_code}")
+                    logger.error("Registration failed: HTTP %s", response.status_code)
                     
             except requests.RequestException as e:
-                logger.error(f"Registration attempt {attempt + 1} failed: {e}")
+                logger.error("Registration attempt %s failed: %s", attempt + 1, e)
                 if attempt < max_retries - 1:
                     time.sleep(5 * (attempt + 1))  # Exponential backoff
         
@@ -311,31 +499,39 @@ class ProductionRenderWorker:
         try:
             system_metrics = self.metrics_collector.get_current_metrics()
             
+            batch_size = self.config.get('metrics_batch_size', 32)
+            samples = []
+            while self._metrics_buf and len(samples) < batch_size:
+                samples.append(self._metrics_buf.popleft())
+            
             payload = {
                 'worker_id': self.worker_id,
                 'system_metrics': system_metrics,
+                'metrics_samples': samples,
                 'current_jobs': list(self.current_jobs.keys()),
                 'status': 'busy' if self.current_jobs else 'idle'
             }
             
-            headers = {}
-            api_key = self.config.get('api_key')
-            if api_key:
-                headers['X-API-Key'] = api_key
-            
-            response = requests.post(
-                f"{self.server_url}/api/workers/heartbeat",
-                json=payload,
-                headers=headers,
-                timeout=10
-            )
+            try:
+                response = self.post_json("/api/workers/heartbeat", payload, timeout=10)
+            except requests.RequestException:
+                self._metrics_buf.extendleft(reversed(samples))
+                raise
             
-            return response.status_code == 200
+            if response.status_code != 200:
+                self._metrics_buf.extendleft(reversed(samples))
+                return False
+            return True
             
         except requests.RequestException as e:
-            logger.error(f"Heartbeat failed: {e}")
+            logger.error("Heartbeat failed: %s", e)
             return False
     
+    def flush_metrics(self):
+        """Send any buffered metric samples with a final heartbeat"""
+        if self._metrics_buf:
+            self.send_heartbeat()
+    
     def get_next_job(self):
         """Get next job with enhanced error handling and memory optimization"""
         # Check if we can take more jobs
@@ -355,19 +551,13 @@ class ProductionRenderWorker:
                     job_data['status'] = 'running'
                     job_data['worker_id'] = self.worker_id
                     cached_job = self.memory_job_cache.pop(job_id)
-                    logger.debug(f"Retrieved job from memory cache: {job_id}")
+                    logger.debug("Retrieved job from memory cache: %s", job_id)
                     return cached_job
         
         try:
-            headers = {}
-            api_key = self.config.get('api_key')
-            if api_key:
-                headers['X-API-Key'] = api_key
-            
-            response = requests.get(
+            response = self._http.get(
                 f"{self.server_url}/api/jobs/next",
                 params={'worker_id': self.worker_id},
-                headers=headers,
                 timeout=15
             )
             
@@ -376,11 +566,11 @@ class ProductionRenderWorker:
             elif response.status_code == 204:
                 return None  # No jobs available
             else:
-                logger.error(f"Failed to get job: HTTP {response.status_code}")
+                logger.error("Failed to get job: HTTP %s", response.status_code)
                 return None
                 
         except requests.RequestException as e:
-            logger.error(f"Failed to get next job: {e}")
+            logger.error("Failed to get next job: %s", e)
             return None
     
     def check_resource_availability(self):
@@ -411,25 +601,20 @@ class ProductionRenderWorker:
                 'metrics': metrics or {}
             }
             
-            headers = {}
-            api_key = self.config.get('api_key')
-            if api_key:
-                headers['X-API-Key'] = api_key
-            
-            response = requests.post(
-                f"{self.server_url}/api/jobs/complete",
-                json=payload,
-                headers=headers,
-                timeout=15
-            )
+            response = self.post_json("/api/jobs/complete", payload, timeout=15)
             
             return response.status_code == 200
             
         except requests.RequestException as e:
-            logger.error(f"Failed to report job completion: {e}")
+            logger.error("Failed to report job completion: %s", e)
             return False
     
     def execute_render_job(self, job):
+        """Execute job while holding a render slot to avoid oversubscribing the CPU"""
+        with self._render_sem:
+            self.run_render_job(job)
+    
+    def run_render_job(self, job):
         """Execute job with comprehensive error handling and RAM optimization"""
         sub_job_id = job['sub_job_id']
         frame_range = job['frame_range']
@@ -447,8 +632,7 @@ class ProductionRenderWorker:
         project_file = job_data.get('processed_file_path', job_data['file_path'])
         if hasattr(self, 'asset_cache') and os.path.exists(project_file):
             try:
-                cached_data = self.asset_cache.get_file(project_file)
-                logger.debug(f"Project file cached: {len(cached_data)} bytes")
+                logger.debug("Project file cached: %d bytes", len(self.asset_cache.get_file(project_file)))
             except Exception as e:
                 logger.warning(f"Failed to cache project file: {e}")
         
@@ -460,11 +644,16 @@ class ProductionRenderWorker:
             'render_buffer': render_buffer,
             'memory_allocated': render_buffer.size if render_buffer else 0
         }
+        output_future = None
         
         try:
+            self.on_task_start(sub_job_id)
+            
             renderer = job_data['renderer']
             executable = job_data['executable_path']
             project_file = job_data.get('processed_file_path', job_data['file_path'])
+            spec = JobSpec(frame_range, job_data.get('extra_args', ''),
+                           self.config.get('timeout_per_frame', 1800))
             
             # Validate renderer availability
             if renderer not in self.capabilities['renderers']:
@@ -478,15 +667,15 @@ class ProductionRenderWorker:
             # Execute render based on type
             if renderer == 'nuke':
                 success, error, metrics = self.render_nuke_production(
-                    executable, project_file, frame_range, job_data, sub_job_id
+                    executable, project_file, spec, job_data, sub_job_id
                 )
             elif renderer == 'silhouette':
                 success, error, metrics = self.render_silhouette_production(
-                    executable, project_file, frame_range, job_data, sub_job_id
+                    executable, project_file, spec, job_data, sub_job_id
                 )
             elif renderer == 'fusion':
                 success, error, metrics = self.render_fusion_production(
-                    executable, project_file, frame_range, job_data, sub_job_id
+                    executable, project_file, spec, job_data, sub_job_id
                 )
             else:
                 raise Exception(f"Unknown renderer: {renderer}")
@@ -499,116 +688,139 @@ class ProductionRenderWorker:
                 'timestamp': datetime.now().isoformat()
             })
             
-            # Report completion with enhanced metrics
-            self.report_job_completion(sub_job_id, success, error, metrics)
+            output_future = metrics.pop('output_future', None)
+            if output_future is not None:
+                output_future.add_done_callback(
+                    lambda future: self.report_render_outputs(sub_job_id, future, metrics)
+                )
+            else:
+                self.report_job_completion(sub_job_id, success, error, metrics)
             
             if success:
-                output_info = metrics.get('output_info', {})
-                render_time = metrics.get('render_time', 0)
-                frames_count = output_info.get('total_files', 0)
-                total_size = output_info.get('total_size_mb', 0)
-                
-                logger.info(f" Job {sub_job_id} completed in {render_time:.1f}s")
-                logger.info(f" Rendered {frames_count} frames ({total_size:.1f}MB)")
-                
-                # Log output directories
-                for output_dir in output_info.get('directories', []):
-                    logger.info(f" Output saved to: {output_dir}")
+                logger.info(f" Job {sub_job_id} completed in {metrics.get('render_time', 0):.1f}s")
             else:
-                logger.error(f" Job {sub_job_id} failed: {error}")
+                logger.error(" Job %s failed: %s", sub_job_id, error)
                 
         except Exception as e:
             error_msg = f"Job execution failed: {str(e)}"
-            logger.error(error_msg)
+            logger.error("Job execution failed: %s", e)
             self.report_job_completion(sub_job_id, False, error_msg)
         
         finally:
-            # Clean up resources
-            if sub_job_id in self.current_jobs:
-                job_info = self.current_jobs[sub_job_id]
-                
-                # Return render buffer to pool
-                if hasattr(self, 'render_buffer_pool') and job_info.get('render_buffer'):
-                    self.render_buffer_pool.return_buffer(sub_job_id)
-                
-                # Remove from current jobs
+            if output_future is None:
+                self.release_job(sub_job_id)
+    
+    def release_job(self, sub_job_id):
+        """Free a finished job's resources once its completion has been reported"""
+        # Clean up resources
+        if sub_job_id in self.current_jobs:
+            job_info = self.current_jobs[sub_job_id]
+            
+            # Return render buffer to pool
+            if hasattr(self, 'render_buffer_pool') and job_info.get('render_buffer'):
+                self.render_buffer_pool.return_buffer(sub_job_id)
+            
+            self._peak_memory_cache.pop(sub_job_id, None)
+            
+            # Remove from current jobs
+            with self._jobs_done:
                 del self.current_jobs[sub_job_id]
-                
-                # Log performance summary
-                if hasattr(self, 'render_stats'):
-                    cache_stats = self.asset_cache.get_stats() if hasattr(self, 'asset_cache') else {}
-                    logger.info(f" Performance Summary - Jobs: {self.render_stats['jobs_completed']}, "
-                              f"Cache Hit Rate: {cache_stats.get('hit_ratio', 0):.1f}%, "
-                              f"Memory Usage: {cache_stats.get('cache_size_gb', 0):.2f}GB")
+                if not self.current_jobs:
+                    self._jobs_done.notify_all()
+            
+            self.on_task_end(sub_job_id)
+            
+            # Log performance summary
+            if hasattr(self, 'render_stats'):
+                cache_stats = self.asset_cache.get_stats() if hasattr(self, 'asset_cache') else {}
+                logger.info(f" Performance Summary - Jobs: {self.render_stats['jobs_completed']}, "
+                          f"Cache Hit Rate: {cache_stats.get('hit_ratio', 0):.1f}%, "
+                          f"Memory Usage: {cache_stats.get('cache_size_gb', 0):.2f}GB")
+    
+    def render_env(self, job_id):
+        """Subprocess environment exposing the job's shared render buffer by name"""
+        render_buffer = self.current_jobs.get(job_id, {}).get('render_buffer')
+        if render_buffer is None:
+            return None
+        return dict(os.environ, RENDER_BUFFER_NAME=render_buffer.name,
+                    RENDER_BUFFER_SIZE=str(render_buffer.size))
     
-    def render_nuke_production(self, executable, project_file, frame_range, job_data, batch_id):
+    def report_render_outputs(self, sub_job_id, output_future, metrics):
+        """Report a successful job once output detection finishes, then release it"""
+        try:
+            output_info = {}
+            if output_future.cancelled():
+                logger.warning(f"Output detection cancelled for job {sub_job_id}")
+            elif output_future.exception() is not None:
+                logger.warning(f"Output detection failed for job {sub_job_id}: {output_future.exception()}")
+            else:
+                output_info = output_future.result()
+                metrics['output_info'] = output_info
+                self.output_locations[sub_job_id] = output_info
+            self.report_job_completion(sub_job_id, True, None, metrics)
+            
+            logger.info(f" Rendered {output_info.get('total_files', 0)} frames "
+                        f"({output_info.get('total_size_mb', 0):.1f}MB)")
+            for output_dir in output_info.get('directories', []):
+                logger.info(f" Output saved to: {output_dir}")
+        finally:
+            self.release_job(sub_job_id)
+    
+    def render_nuke_production(self, executable, project_file, spec, job_data, batch_id):
         """Production Nuke render with UNC path support"""
         start_time = time.time()
+        verbose = self.config.get('verbose_render_logs', False)
         
         try:
-            logger.info(f"=== RENDER DEBUG INFO ===")
-            logger.info(f"Executable: {executable}")
-            logger.info(f"Project file: {project_file}")
-            logger.info(f"Frame range: {frame_range}")
-            logger.info(f"Working directory: {os.getcwd()}")
-            logger.info(f"Batch ID: {batch_id}")
+            if verbose:
+                logger.info("=== RENDER DEBUG INFO ===")
+                logger.info("Executable: %s", executable)
+                logger.info("Project file: %s", project_file)
+                logger.info("Frame range: %s", spec.frame_range)
+                logger.info("Working directory: %s", os.getcwd())
+                logger.info("Batch ID: %s", batch_id)
             
             # Check if executable exists
             if not os.path.exists(executable):
-                logger.error(f" Executable not found: {executable}")
+                logger.error(" Executable not found: %s", executable)
                 return False, f"Executable not found: {executable}", {'render_time': 0}
-            else:
-                logger.info(f" Executable exists: {executable}")
             
             # Check if project file exists
             if not os.path.exists(project_file):
-                logger.error(f" Project file not found: {project_file}")
+                logger.error(" Project file not found: %s", project_file)
                 return False, f"Project file not found: {project_file}", {'render_time': 0}
-            else:
-                logger.info(f" Project file exists: {project_file}")
-                logger.info(f"Project file size: {os.path.getsize(project_file)} bytes")
             
-            # Parse frame range
-            if '-' in frame_range:
-                start_frame, end_frame = frame_range.split('-')
-            else:
-                start_frame = end_frame = frame_range
-            
-            logger.info(f"Parsed frames: {start_frame} to {end_frame}")
+            if verbose:
+                logger.info("Project file size: %d bytes", os.path.getsize(project_file))
             
             # Build command with proper absolute paths
             cmd = [
                 os.path.abspath(executable),
                 '-i', '-f', '-x', '-m', '3',
-                '-F', f"{start_frame}-{end_frame}",
+                *spec.nuke_frame_args(),
                 '-m', '14', '-V',
                 '--', os.path.abspath(project_file)
             ]
             
             # Add extra arguments
-            extra_args = job_data.get('extra_args', '')
-            if extra_args:
-                cmd_with_args = cmd[:-2] + extra_args.split() + cmd[-2:]
-                cmd = cmd_with_args
-                logger.info(f"Added extra args: {extra_args}")
+            if spec.extra_args:
+                cmd = cmd[:-2] + spec.extra_args + cmd[-2:]
             
-            logger.info(f"Full command: {' '.join(cmd)}")
+            logger.info("Full command: %s", ' '.join(cmd))
             
             # Set working directory - avoid UNC paths for Windows CMD
             work_dir = os.path.dirname(os.path.abspath(project_file))
             if work_dir.startswith('\\\\'):
                 # UNC path - use local directory to avoid CMD issues
                 safe_work_dir = "C:\\"
-                logger.info(f"UNC path detected, using safe working directory: {safe_work_dir}")
+                logger.info("UNC path detected, using safe working directory: %s", safe_work_dir)
             else:
                 safe_work_dir = work_dir
-                logger.info(f"Working directory: {safe_work_dir}")
             
             # Create batch file for Windows with UNC path handling
             batch_file = None
             if platform.system() == 'Windows':
                 batch_file = self.temp_dir / f"nuke_{batch_id}.cmd"
-                logger.info(f"Creating batch file: {batch_file}")
                 
                 # Create batch content with UNC path support
                 batch_content = []
@@ -620,16 +832,18 @@ class ProductionRenderWorker:
                 batch_content.append("echo Starting Nuke render...")
                 
                 # Use absolute paths for the command (including UNC paths)
-                nuke_cmd = f'"{cmd[0]}" -i -f -x -m 3 -F {start_frame}-{end_frame} -m 14 -V -- "{cmd[-1]}"'
+                frame_args = ' '.join(spec.nuke_frame_args())
+                nuke_cmd = f'"{cmd[0]}" -i -f -x -m 3 {frame_args} -m 14 -V -- "{cmd[-1]}"'
                 batch_content.append(nuke_cmd)
                 batch_content.append("echo Nuke render completed with exit code: %ERRORLEVEL%")
                 
                 with open(batch_file, 'w') as f:
                     f.write('\n'.join(batch_content))
                 
-                logger.info(f"Batch file contents:")
-                for line in batch_content:
-                    logger.info(f"  {line}")
+                if verbose:
+                    logger.info("Batch file contents:")
+                    for line in batch_content:
+                        logger.info("  %s", line)
                 
                 # Execute batch file
                 cmd = ["cmd", "/c", str(batch_file.absolute())]
@@ -637,14 +851,13 @@ class ProductionRenderWorker:
             else:
                 shell = False
             
-            logger.info(f"Executing command: {' '.join(cmd)}")
-            logger.info(f"Shell mode: {shell}")
-            logger.info(f"Safe working directory: {safe_work_dir}")
+            if verbose:
+                logger.info("Executing command: %s", ' '.join(cmd))
+                logger.info("Shell mode: %s", shell)
+                logger.info("Safe working directory: %s", safe_work_dir)
             
-            # Calculate timeout
-            frame_count = int(end_frame) - int(start_frame) + 1 if '-' in frame_range else 1
-            timeout = frame_count * self.config.get('timeout_per_frame', 1800)
-            logger.info(f"Timeout: {timeout}s for {frame_count} frames")
+            frame_count = spec.frame_count
+            logger.info("Timeout: %ss for %d frames", spec.timeout, frame_count)
             
             # Monitor execution with safe working directory
             with subprocess.Popen(
@@ -653,19 +866,21 @@ class ProductionRenderWorker:
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
-                cwd=safe_work_dir
+                cwd=safe_work_dir,
+                env=self.render_env(batch_id)
             ) as process:
                 
-                logger.info(f"Process started with PID: {process.pid}")
+                logger.info("Process started with PID: %d", process.pid)
                 
                 # Monitor process with resource tracking
-                stdout, stderr = self.monitor_process(process, timeout, batch_id)
+                stdout, stderr = self.monitor_process(process, spec.timeout, batch_id)
             
             render_time = time.time() - start_time
             
-            logger.info(f"Process completed with return code: {process.returncode}")
-            logger.info(f"STDOUT: {stdout[:500]}...")  # First 500 chars
-            logger.info(f"STDERR: {stderr[:500]}...")  # First 500 chars
+            logger.info("Process completed with return code: %s", process.returncode)
+            if verbose:
+                logger.info("STDOUT: %s...", stdout[:500])
+                logger.info("STDERR: %s...", stderr[:500])
             
             # Clean up batch file
             if platform.system() == 'Windows' and batch_file and batch_file.exists():
@@ -674,41 +889,38 @@ class ProductionRenderWorker:
             
             # Analyze results
             if process.returncode == 0:
-                output_info = self.detect_output_files(project_file, frame_range, job_data)
+                output_future = self._output_pool.submit(
+                    self.detect_output_files, project_file, spec, job_data
+                )
                 
-                # Enhanced metrics with output information
                 metrics = {
                     'render_time': render_time,
-                    'output_info': output_info,
+                    'output_future': output_future,
                     'memory_peak': self.get_peak_memory_usage(batch_id),
                     'frames_rendered': frame_count,
                     'cache_stats': self.asset_cache.get_stats() if hasattr(self, 'asset_cache') else {}
                 }
                 
-                # Store output location for this job
-                if hasattr(self, 'output_locations'):
-                    self.output_locations[batch_id] = output_info
-                
                 # Update render stats
                 if hasattr(self, 'render_stats'):
                     self.render_stats['jobs_completed'] += 1
                     self.render_stats['frames_rendered'] += frame_count
                     self.render_stats['total_render_time'] += render_time
                 
-                logger.info(f"✅ Nuke render successful! {output_info.get('total_files', 0)} files rendered")
+                logger.info("✅ Nuke render successful!")
                 return True, None, metrics
             else:
                 error_msg = f"Nuke render failed (exit {process.returncode}): {stderr}"
-                logger.error(f"❌ Render failed: {error_msg}")
+                logger.error("❌ Render failed: %s", error_msg)
                 return False, error_msg, {'render_time': render_time}
                 
         except subprocess.TimeoutExpired:
-            error_msg = f"Render timed out after {timeout}s"
-            logger.error(f"❌ {error_msg}")
+            error_msg = f"Render timed out after {spec.timeout}s"
+            logger.error("❌ %s", error_msg)
             return False, error_msg, {'render_time': time.time() - start_time}
         except Exception as e:
             error_msg = f"Render execution error: {str(e)}"
-            logger.error(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             logger.exception("Full traceback:")
             
             # Return buffer to pool if it was allocated
@@ -717,35 +929,27 @@ class ProductionRenderWorker:
             
             return False, error_msg, {'render_time': time.time() - start_time}
     
-    def render_silhouette_production(self, executable, project_file, frame_range, job_data, batch_id):
+    def render_silhouette_production(self, executable, project_file, spec, job_data, batch_id):
         """Production Silhouette render with monitoring"""
         start_time = time.time()
         
         try:
             # Build command
-            cmd = [executable, '-range', frame_range, project_file]
-            
-            # Add extra arguments
-            extra_args = job_data.get('extra_args', '')
-            if extra_args:
-                cmd.extend(extra_args.split())
+            cmd = [executable, '-range', spec.frame_range, project_file] + spec.extra_args
             
             logger.info(f"Executing Silhouette: {' '.join(cmd)}")
             
-            # Calculate timeout
-            frame_count = len(frame_range.split('-')) if '-' in frame_range else 1
-            timeout = frame_count * self.config.get('timeout_per_frame', 1800)
-            
             # Execute with monitoring
             with subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
-                cwd=os.path.dirname(project_file)
+                cwd=os.path.dirname(project_file),
+                env=self.render_env(batch_id)
             ) as process:
                 
-                stdout, stderr = self.monitor_process(process, timeout, batch_id)
+                stdout, stderr = self.monitor_process(process, spec.timeout, batch_id)
             
             render_time = time.time() - start_time
             
@@ -760,48 +964,34 @@ class ProductionRenderWorker:
                 return False, error_msg, {'render_time': render_time}
                 
         except subprocess.TimeoutExpired:
-            return False, f"Render timed out after {timeout}s", {'render_time': time.time() - start_time}
+            return False, f"Render timed out after {spec.timeout}s", {'render_time': time.time() - start_time}
         except Exception as e:
             return False, f"Render execution error: {str(e)}", {'render_time': time.time() - start_time}
     
-    def render_fusion_production(self, executable, project_file, frame_range, job_data, batch_id):
+    def render_fusion_production(self, executable, project_file, spec, job_data, batch_id):
         """Production Fusion render with monitoring"""
         start_time = time.time()
         
         try:
-            # Parse frame range
-            if '-' in frame_range:
-                start_frame, end_frame = frame_range.split('-')
-            else:
-                start_frame = end_frame = frame_range
-            
             # Build command
             cmd = [
                 executable, project_file,
-                '/render', '/start', start_frame, '/end', end_frame
-            ]
-            
-            # Add extra arguments
-            extra_args = job_data.get('extra_args', '')
-            if extra_args:
-                cmd.extend(extra_args.split())
+                '/render', '/start', str(spec.start_frame), '/end', str(spec.end_frame)
+            ] + spec.extra_args
             
             logger.info(f"Executing Fusion: {' '.join(cmd)}")
             
-            # Calculate timeout
-            frame_count = int(end_frame) - int(start_frame) + 1 if '-' in frame_range else 1
-            timeout = frame_count * self.config.get('timeout_per_frame', 1800)
-            
             # Execute with monitoring
             with subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
-                cwd=os.path.dirname(project_file)
+                cwd=os.path.dirname(project_file),
+                env=self.render_env(batch_id)
             ) as process:
                 
-                stdout, stderr = self.monitor_process(process, timeout, batch_id)
+                stdout, stderr = self.monitor_process(process, spec.timeout, batch_id)
             
             render_time = time.time() - start_time
             
@@ -816,16 +1006,22 @@ class ProductionRenderWorker:
                 return False, error_msg, {'render_time': render_time}
                 
         except subprocess.TimeoutExpired:
-            return False, f"Render timed out after {timeout}s", {'render_time': time.time() - start_time}
+            return False, f"Render timed out after {spec.timeout}s", {'render_time': time.time() - start_time}
         except Exception as e:
             return False, f"Render execution error: {str(e)}", {'render_time': time.time() - start_time}
     
     def monitor_process(self, process, timeout, job_id):
         """Monitor process execution with resource tracking"""
         start_time = time.time()
-        stdout_lines = []
-        stderr_lines = []
         peak_memory = 0
+        stdout_future = self._io_pool.submit(drain_stream, process.stdout)
+        stderr_future = self._io_pool.submit(drain_stream, process.stderr)
+        
+        pidfd = open_pidfd(process.pid)
+        poller = None
+        if pidfd is not None:
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
         
         try:
             # Get process for monitoring
@@ -847,10 +1043,13 @@ class ProductionRenderWorker:
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     pass
                 
-                time.sleep(1)
+                if poller:
+                    poller.poll(1000)
+                else:
+                    time.sleep(1)
             
             # Get final output
-            stdout, stderr = process.communicate()
+            stdout, stderr = stdout_future.result(), stderr_future.result()
             
             # Store peak memory for this job
             self.store_peak_memory(job_id, peak_memory)
@@ -858,20 +1057,24 @@ class ProductionRenderWorker:
             return stdout, stderr
             
         except Exception as e:
-            logger.error(f"Process monitoring error: {e}")
+            logger.error("Process monitoring error: %s", e)
             return "", str(e)
+        
+        finally:
+            if pidfd is not None:
+                os.close(pidfd)
     
     def store_peak_memory(self, job_id, peak_memory_mb):
         """Store peak memory usage for job"""
-        self._peak_memory_cache = getattr(self, '_peak_memory_cache', {})
         self._peak_memory_cache[job_id] = peak_memory_mb
+        while len(self._peak_memory_cache) > MAX_PEAK_ENTRIES:
+            self._peak_memory_cache.popitem(last=False)
     
     def get_peak_memory_usage(self, job_id):
         """Get stored peak memory usage"""
-        cache = getattr(self, '_peak_memory_cache', {})
-        return cache.get(job_id, 0)
+        return self._peak_memory_cache.get(job_id, 0)
     
-    def detect_output_files(self, project_file, frame_range, job_data=None):
+    def detect_output_files(self, project_file, spec, job_data=None):
         """Enhanced output file detection with comprehensive reporting"""
         output_files = []
         output_directories = set()
@@ -891,11 +1094,11 @@ class ProductionRenderWorker:
             for write_info in output_info:
                 output_pattern = write_info.get('file_path', '')
                 if output_pattern:
-                    rendered_files = self.find_rendered_frames(output_pattern, frame_range)
+                    rendered_files = self.find_rendered_frames(output_pattern, spec)
                     output_files.extend(rendered_files)
                     
                     if rendered_files:
-                        output_dir = os.path.dirname(rendered_files[0])
+                        output_dir = os.path.dirname(rendered_files[0][0])
                         output_directories.add(output_dir)
             
             # Fallback: search common output locations
@@ -907,67 +1110,62 @@ class ProductionRenderWorker:
                     os.path.join(os.path.dirname(project_file), 'comp')
                 ]
                 
-                for search_dir in fallback_dirs:
-                    if os.path.exists(search_dir):
-                        pattern_files = self.find_rendered_frames_in_dir(search_dir, frame_range)
-                        if pattern_files:
-                            output_files.extend(pattern_files)
-                            output_directories.add(search_dir)
+                scan_cache = {d: self.scan_directory(d) for d in fallback_dirs if os.path.isdir(d)}
+                
+                for search_dir, entries in scan_cache.items():
+                    pattern_files = self.find_rendered_frames_in_dir(search_dir, spec, entries)
+                    if pattern_files:
+                        output_files.extend(pattern_files)
+                        output_directories.add(search_dir)
             
             # Log detailed output information
             if output_files:
                 logger.info(f"✅ RENDER OUTPUT DETECTED:")
                 for output_dir in sorted(output_directories):
-                    dir_files = [f for f in output_files if f.startswith(output_dir)]
+                    dir_files = [f for f in output_files if os.path.dirname(f[0]) == output_dir]
                     logger.info(f"📁 Output Directory: {output_dir}")
                     logger.info(f"   📄 Files: {len(dir_files)} frames")
                     
                     # Show sample files
-                    for i, file_path in enumerate(sorted(dir_files)[:3]):
-                        file_size = os.path.getsize(file_path) if os.path.exists(file_path) else 0
+                    for file_path, file_size in sorted(dir_files)[:3]:
                         logger.info(f"   ├─ {os.path.basename(file_path)} ({file_size/1024/1024:.1f}MB)")
                     
                     if len(dir_files) > 3:
                         logger.info(f"   └─ ... and {len(dir_files)-3} more files")
                 
                 # Summary
-                total_size = sum(os.path.getsize(f) for f in output_files if os.path.exists(f))
+                total_size = sum(file_size for _, file_size in output_files)
                 logger.info(f"🎬 RENDER COMPLETE: {len(output_files)} frames, {total_size/1024/1024:.1f}MB total")
                 
                 # Store output locations for reporting
                 return {
-                    'files': output_files[:50],  # Limit for performance
+                    'files': [file_path for file_path, _ in output_files[:50]],  # Limit for performance
                     'directories': list(output_directories),
                     'total_files': len(output_files),
                     'total_size_mb': total_size / 1024 / 1024,
-                    'frame_range': frame_range
+                    'frame_range': spec.frame_range
                 }
             else:
-                logger.warning(f"⚠️  No output files found for frames {frame_range}")
+                logger.warning(f"⚠️  No output files found for frames {spec.frame_range}")
                 return {'files': [], 'directories': [], 'total_files': 0, 'total_size_mb': 0}
                 
         except Exception as e:
-            logger.error(f"Error detecting output files: {e}")
+            logger.error("Error detecting output files: %s", e)
             return {'files': [], 'directories': [], 'total_files': 0, 'total_size_mb': 0, 'error': str(e)}
     
     def parse_nuke_write_nodes(self, nuke_file):
         """Parse Nuke script to find Write node output paths"""
         write_nodes = []
         try:
-            with open(nuke_file, 'r') as f:
-                content = f.read()
-            
-            # Find Write nodes with file paths
-            import re
-            write_pattern = r'Write \{[^}]*?file "([^"]+)"[^}]*?\}'
-            matches = re.findall(write_pattern, content, re.DOTALL)
-            
-            for file_path in matches:
-                # Handle sequence notation (%04d, ####, etc.)
-                write_nodes.append({
-                    'type': 'write',
-                    'file_path': file_path
-                })
+            with open(nuke_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                for header in _WRITE_HEADER_RE.finditer(content):
+                    block_end = find_block_end(content, header.end())
+                    match = _WRITE_FILE_RE.search(content, header.end(), block_end)
+                    if match:
+                        write_nodes.append({
+                            'type': 'write',
+                            'file_path': match.group(1).decode('utf-8', 'replace')
+                        })
                 
         except Exception as e:
             logger.debug(f"Failed to parse Nuke write nodes: {e}")
@@ -984,23 +1182,19 @@ class ProductionRenderWorker:
         # Simplified - would need proper Fusion parsing
         return []
     
-    def find_rendered_frames(self, file_pattern, frame_range):
-        """Find rendered frames based on file pattern and frame range"""
+    def find_rendered_frames(self, file_pattern, spec):
+        """Find rendered frames as (path, size) pairs from file pattern and frame range"""
         rendered_files = []
         
         try:
-            # Parse frame range
-            if '-' in frame_range:
-                start_frame, end_frame = map(int, frame_range.split('-'))
-                frame_numbers = list(range(start_frame, end_frame + 1))
-            else:
-                frame_numbers = [int(frame_range)]
-            
             # Handle different sequence notations
             base_dir = os.path.dirname(file_pattern)
             base_name = os.path.basename(file_pattern)
             
-            for frame_num in frame_numbers:
+            with os.scandir(base_dir or '.') as entries:
+                existing = {entry.name: entry for entry in entries}
+            
+            for frame_num in spec.frames:
                 # Try different frame padding patterns
                 patterns_to_try = [
                     base_name.replace('%04d', f'{frame_num:04d}'),
@@ -1014,9 +1208,9 @@ class ProductionRenderWorker:
                 ]
                 
                 for pattern in patterns_to_try:
-                    full_path = os.path.join(base_dir, pattern)
-                    if os.path.exists(full_path):
-                        rendered_files.append(full_path)
+                    entry = existing.get(pattern)
+                    if entry is not None:
+                        rendered_files.append((os.path.join(base_dir, pattern), entry.stat().st_size))
                         break
                         
         except Exception as e:
@@ -1024,39 +1218,31 @@ class ProductionRenderWorker:
         
         return rendered_files
     
-    def find_rendered_frames_in_dir(self, search_dir, frame_range):
-        """Search directory for rendered frames"""
+    def scan_directory(self, search_dir):
+        """Return the directory entries of search_dir, or an empty list"""
+        try:
+            with os.scandir(search_dir) as entries:
+                return list(entries)
+        except OSError as e:
+            logger.debug(f"Error scanning directory {search_dir}: {e}")
+            return []
+    
+    def find_rendered_frames_in_dir(self, search_dir, spec, entries=None):
+        """Search directory for rendered frames as (path, size) pairs"""
         rendered_files = []
+        if entries is None:
+            entries = self.scan_directory(search_dir)
         
         try:
-            # Parse frame range
-            if '-' in frame_range:
-                start_frame, end_frame = map(int, frame_range.split('-'))
-                frame_numbers = list(range(start_frame, end_frame + 1))
-            else:
-                frame_numbers = [int(frame_range)]
-            
-            # Common render file extensions
-            extensions = ['.exr', '.png', '.jpg', '.jpeg', '.tif', '.tiff', '.dpx']
-            
-            for ext in extensions:
-                for frame_num in frame_numbers:
-                    # Try common naming patterns
-                    patterns = [
-                        f"*{frame_num:04d}{ext}",
-                        f"*_{frame_num:04d}{ext}",
-                        f"*.{frame_num:04d}{ext}",
-                        f"*{frame_num}{ext}"
-                    ]
+            for entry in entries:
+                match = _FRAME_RE.search(entry.name)
+                if match and int(match.group(1)) in spec.frames and entry.is_file():
+                    rendered_files.append((entry.path, entry.stat().st_size))
                     
-                    for pattern in patterns:
-                        matches = list(Path(search_dir).glob(pattern))
-                        rendered_files.extend([str(f) for f in matches])
-                        
         except Exception as e:
             logger.debug(f"Error searching directory {search_dir}: {e}")
         
-        return list(set(rendered_files))  # Remove duplicates
+        return rendered_files
     
     def start(self):
         """Start worker with enhanced resilience"""
@@ -1084,6 +1270,10 @@ class ProductionRenderWorker:
                 
                 if job:
                     consecutive_failures = 0
+                    if self.config.get('max_concurrent_renders', 1) == 1:
+                        self.execute_render_job(job)
+                        continue
+                    
                     # Execute in separate thread for better resource management
                     job_thread = threading.Thread(
                         target=self.execute_render_job,
@@ -1093,136 +1283,178 @@ class ProductionRenderWorker:
                     job_thread.start()
                     
                     # Dynamic polling based on system capability
-                    available_ram_gb = psutil.virtual_memory().total / (1024**3)
-                    if available_ram_gb >= 32:
-                        # High-end systems can handle faster polling
-                        time.sleep(5)  # Faster for high-end systems
-                    else:
-                        # Standard polling for regular systems
-                        time.sleep(10)
+                    self._stop_event.wait(self._poll_busy)
                 else:
                     # No jobs available - wait based on system capability
-                    available_ram_gb = psutil.virtual_memory().total / (1024**3)
-                    if available_ram_gb >= 32:
-                        time.sleep(15)  # Faster polling when no jobs (high-end)
-                    else:
-                        time.sleep(30)  # Standard wait (regular systems)
+                    self._stop_event.wait(self._poll_idle)
                     
             except KeyboardInterrupt:
                 logger.info("Received shutdown signal")
-                self.running = False
+                self.request_stop()
                 break
             except Exception as e:
                 consecutive_failures += 1
-                logger.error(f"Worker error ({consecutive_failures}/{max_failures}): {e}")
+                logger.error("Worker error (%s/%s): %s", consecutive_failures, max_failures, e)
                 
                 if consecutive_failures >= max_failures:
                     logger.error("Too many consecutive failures, shutting down")
-                    self.running = False
+                    self.request_stop()
                 else:
-                    time.sleep(min(60, consecutive_failures * 10))  # Exponential backoff
+                    self._stop_event.wait(min(60, consecutive_failures * 10))  # Exponential backoff
         
         logger.info("🛑 Worker shutdown complete")
     
     def start_background_threads(self):
-        """Start background monitoring threads"""
-        # Heartbeat thread
-        heartbeat_thread = threading.Thread(target=self.heartbeat_loop, daemon=True)
-        heartbeat_thread.start()
-        
-        # Metrics collection thread
-        metrics_thread = threading.Thread(target=self.metrics_loop, daemon=True)
-        metrics_thread.start()
+        """Run heartbeat, metrics and cleanup as tasks on one background event loop"""
+        self._loop = asyncio.new_event_loop()
+        background_thread = threading.Thread(target=self.run_background_loop, name="WorkerBackground", daemon=True)
+        background_thread.start()
+    
+    def run_background_loop(self):
+        """Drive the periodic background tasks until the worker stops"""
+        deprioritize_current_thread(self.config.get('background_cpu'))
+        asyncio.set_event_loop(self._loop)
+        self._async_stop = asyncio.Event()
+        self._metrics_wake = asyncio.Event()
+        if not self.running:
+            self._async_stop.set()
+        self.metrics_collector.start_cpu_sampler(self._loop)
         
-        # Cleanup thread
-        cleanup_thread = threading.Thread(target=self.cleanup_loop, daemon=True)
-        cleanup_thread.start()
+        try:
+            self._loop.run_until_complete(asyncio.gather(
+                self.heartbeat_loop(), self.metrics_loop(), self.cleanup_loop()
+            ))
+        finally:
+            self._loop.close()
     
-    def heartbeat_loop(self):
+    async def wait_or_stop(self, timeout, event=None):
+        """Sleep for timeout seconds, returning True early once event (default: stop) is set"""
+        try:
+            await asyncio.wait_for((event or self._async_stop).wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
+    def set_loop_event(self, event):
+        """Set an asyncio event of the background loop from any thread"""
+        if self._loop is not None and event is not None:
+            try:
+                self._loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                pass
+    
+    def request_stop(self):
+        """Flag the worker as stopping and wake every waiting loop"""
+        self.running = False
+        self._stop_event.set()
+        self.set_loop_event(self._async_stop)
+        self.set_loop_event(self._metrics_wake)
+    
+    def record_metrics_sample(self, event=None, sub_job_id=None):
+        """Take one metrics sample and queue it for the next heartbeat"""
+        metrics = self.metrics_collector.get_current_metrics()
+        if event:
+            metrics['event'] = event
+            metrics['sub_job_id'] = sub_job_id
+        self._metrics_buf.append(metrics)
+        return metrics
+    
+    def on_task_start(self, sub_job_id):
+        """Sample metrics as a job starts and restart the periodic timer"""
+        self.record_metrics_sample('task_start', sub_job_id)
+        self.set_loop_event(self._metrics_wake)
+    
+    def on_task_end(self, sub_job_id):
+        """Sample metrics as a job ends and restart the periodic timer"""
+        self.record_metrics_sample('task_end', sub_job_id)
+        self.set_loop_event(self._metrics_wake)
+    
+    async def heartbeat_loop(self):
         """Enhanced heartbeat loop with reconnection"""
         consecutive_failures = 0
         max_failures = 6
-        # Dynamic heartbeat based on system capability
-        available_ram_gb = psutil.virtual_memory().total / (1024**3)
-        if available_ram_gb >= 32:
-            interval = self.config.get('heartbeat_interval', 20)  # Faster heartbeat for high-end systems
-        else:
-            interval = self.config.get('heartbeat_interval', 45)  # Standard heartbeat
+        interval = self._heartbeat_interval
         
         while self.running:
             try:
-                if self.send_heartbeat():
+                if await self._loop.run_in_executor(self._send_pool, self.send_heartbeat):
                     consecutive_failures = 0
                 else:
                     consecutive_failures += 1
                     if consecutive_failures >= max_failures:
                         logger.error("Lost connection to server, attempting re-registration")
-                        if self.register_with_server():
+                        if await self._loop.run_in_executor(self._send_pool, self.register_with_server):
                             consecutive_failures = 0
                         else:
                             logger.error("Re-registration failed, shutting down")
-                            self.running = False
+                            self.request_stop()
                             break
                 
-                time.sleep(interval)
+                await self.wait_or_stop(interval)
                 
             except Exception as e:
-                logger.error(f"Heartbeat error: {e}")
-                time.sleep(interval)
+                logger.error("Heartbeat error: %s", e)
+                await self.wait_or_stop(interval)
     
-    def metrics_loop(self):
-        """Periodic metrics collection and cleanup"""
+    async def metrics_loop(self):
+        """Fallback metrics sampling when no task boundary has been seen for an interval"""
         interval = self.config.get('metrics_interval', 60)  # Reduced metrics collection frequency
         
         while self.running:
             try:
                 # Collect and log performance metrics
-                metrics = self.metrics_collector.get_current_metrics()
+                metrics = self.record_metrics_sample()
                 logger.debug(f"System metrics: CPU {metrics['cpu_percent']:.1f}%, "
                            f"Memory {metrics['memory_percent']:.1f}%, "
                            f"Disk {metrics['disk_free_gb']:.1f}GB free")
                 
-                time.sleep(interval)
+                while await self.wait_or_stop(interval, self._metrics_wake):
+                    self._metrics_wake.clear()
+                    if not self.running:
+                        break
                 
             except Exception as e:
-                logger.error(f"Metrics collection error: {e}")
-                time.sleep(interval)
+                logger.error("Metrics collection error: %s", e)
+                await self.wait_or_stop(interval)
     
-    def cleanup_loop(self):
+    async def cleanup_loop(self):
         """Periodic cleanup of temp files and logs"""
         while self.running:
             try:
                 # Clean up old temp files (older than 24 hours)
                 cutoff_time = time.time() - 86400
-                for temp_file in self.temp_dir.glob("*"):
-                    if temp_file.stat().st_mtime < cutoff_time:
-                        try:
-                            temp_file.unlink()
-                        except:
-                            pass
+                with os.scandir(self.temp_dir) as entries:
+                    expired = [entry.path for entry in entries
+                               if entry.is_file() and entry.stat().st_mtime < cutoff_time]
+                
+                for temp_path in expired:
+                    try:
+                        os.unlink(temp_path)
+                    except OSError:
+                        pass
                 
                 # Trim render history (keep last 100 entries)
                 if len(self.render_history) > 100:
                     self.render_history = self.render_history[-100:]
                 
-                time.sleep(3600)  # Run every hour
+                await self.wait_or_stop(3600)  # Run every hour
                 
             except Exception as e:
-                logger.error(f"Cleanup error: {e}")
-                time.sleep(3600)
+                logger.error("Cleanup error: %s", e)
+                await self.wait_or_stop(3600)
     
     def stop(self):
         """Enhanced graceful shutdown with resource cleanup"""
         logger.info("Initiating enhanced graceful shutdown...")
-        self.running = False
+        self.request_stop()
         
         # Wait for current jobs to complete (with timeout)
         shutdown_timeout = 300  # 5 minutes
-        start_time = time.time()
         
-        while self.current_jobs and (time.time() - start_time) < shutdown_timeout:
-            logger.info(f"Waiting for {len(self.current_jobs)} jobs to complete...")
-            time.sleep(10)
+        with self._jobs_done:
+            if self.current_jobs:
+                logger.info(f"Waiting for {len(self.current_jobs)} jobs to complete...")
+            self._jobs_done.wait_for(lambda: not self.current_jobs, timeout=shutdown_timeout)
         
         if self.current_jobs:
             logger.warning(f"Shutdown timeout reached, {len(self.current_jobs)} jobs still running")
@@ -1232,6 +1464,20 @@ class ProductionRenderWorker:
             if hasattr(self, 'render_buffer_pool'):
                 self.render_buffer_pool.cleanup()
                 logger.info("Render buffer pool cleaned up")
+            
+            if self.current_jobs:
+                if sys.version_info >= (3, 9):
+                    self._io_pool.shutdown(wait=False, cancel_futures=True)
+                else:
+                    self._io_pool.shutdown(wait=False)
+                self._output_pool.shutdown(wait=False)
+            else:
+                self._io_pool.shutdown(wait=True)
+                self._output_pool.shutdown(wait=True)
+            self._send_pool.shutdown(wait=True)
+            self.flush_metrics()
+            self.metrics_collector.shutdown()
+            self._http.close()
                 
             if hasattr(self, 'asset_cache'):
                 cache_stats = self.asset_cache.get_stats()
@@ -1243,7 +1489,7 @@ class ProductionRenderWorker:
                 logger.info(f"Final render stats: {self.render_stats}")
                 
         except Exception as e:
-            logger.error(f"Error during resource cleanup: {e}")
+            logger.error("Error during resource cleanup: %s", e)
         
         logger.info("Enhanced worker stopped")
 
@@ -1254,10 +1500,10 @@ class AssetCache:
         self.cache = OrderedDict()
         self.max_size_bytes = max_size_gb * 1024**3
         self.current_size = 0
-        self.access_times = {}
+        self.sizes = {}
         self.hit_count = 0
         self.miss_count = 0
-        self.lock = threading.RLock()
+        self.lock = threading.Lock()
         
         logger.info(f"Asset cache initialized: {max_size_gb}GB capacity")
     
@@ -1267,24 +1513,27 @@ class AssetCache:
             if file_path in self.cache:
                 # Move to end (most recently used)
                 self.cache.move_to_end(file_path)
-                self.access_times[file_path] = time.time()
                 self.hit_count += 1
-                logger.debug(f"Cache HIT: {file_path}")
+                logger.debug("Cache HIT: %s", file_path)
+                return self.cache[file_path]
+        
+        try:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+        except Exception as e:
+            logger.error("Failed to load file %s: %s", file_path, e)
+            raise
+        
+        with self.lock:
+            if file_path in self.cache:
+                self.cache.move_to_end(file_path)
+                self.hit_count += 1
                 return self.cache[file_path]
             
-            # Cache miss - load file
-            try:
-                with open(file_path, 'rb') as f:
-                    data = f.read()
-                
-                self._add_to_cache(file_path, data)
-                self.miss_count += 1
-                logger.debug(f"Cache MISS: {file_path} ({len(data)} bytes)")
-                return data
-                
-            except Exception as e:
-                logger.error(f"Failed to load file {file_path}: {e}")
-                raise
+            self._add_to_cache(file_path, data)
+            self.miss_count += 1
+            logger.debug("Cache MISS: %s (%d bytes)", file_path, len(data))
+            return data
     
     def _add_to_cache(self, file_path, data):
         """Add file to cache with LRU eviction"""
@@ -1300,8 +1549,8 @@ class AssetCache:
             self._evict_lru()
         
         self.cache[file_path] = data
+        self.sizes[file_path] = file_size
         self.current_size += file_size
-        self.access_times[file_path] = time.time()
         
         logger.debug(f"Cached: {file_path} ({file_size} bytes, {len(self.cache)} files, {self.current_size/1024**3:.2f}GB)")
     
@@ -1311,13 +1560,10 @@ class AssetCache:
             return
             
         # Remove oldest item (first in OrderedDict)
-        oldest_path, oldest_data = self.cache.popitem(last=False)
-        file_size = len(oldest_data)
+        oldest_path, _ = self.cache.popitem(last=False)
+        file_size = self.sizes.pop(oldest_path)
         self.current_size -= file_size
         
-        if oldest_path in self.access_times:
-            del self.access_times[oldest_path]
-        
         logger.debug(f"Evicted: {oldest_path} ({file_size} bytes)")
     
     def get_stats(self):
@@ -1339,14 +1585,32 @@ class AssetCache:
 class RenderBufferPool:
     """Shared memory pool for render operations"""
     
-    def __init__(self, buffer_size_mb=512, max_buffers=8):
+    def __init__(self, buffer_size_mb=512, max_buffers=8, preallocate=1):
         self.buffer_size = buffer_size_mb * 1024 * 1024
         self.max_buffers = max_buffers
         self.available_buffers = []
         self.in_use_buffers = {}
+        self.total_buffers = 0
         self.lock = threading.Lock()
         
-        logger.info(f"Render buffer pool initialized: {max_buffers} x {buffer_size_mb}MB buffers")
+        for _ in range(min(preallocate, max_buffers)):
+            buffer = self._create_buffer()
+            if buffer is None:
+                break
+            self.available_buffers.append(buffer)
+        
+        logger.info(f"Render buffer pool initialized: {self.total_buffers} x {buffer_size_mb}MB buffers")
+    
+    def _create_buffer(self):
+        """Create one shared memory buffer, or None if the system refuses"""
+        try:
+            buffer = shared_memory.SharedMemory(create=True, size=self.buffer_size)
+        except Exception as e:
+            logger.warning(f"Failed to create shared memory buffer: {e}")
+            return None
+        
+        self.total_buffers += 1
+        return buffer
     
     def get_buffer(self, job_id):
         """Get a render buffer from pool"""
@@ -1354,15 +1618,11 @@ class RenderBufferPool:
             if self.available_buffers:
                 buffer = self.available_buffers.pop()
                 logger.debug(f"Reusing buffer for job {job_id}")
-            elif len(self.in_use_buffers) < self.max_buffers:
-                try:
-                    buffer = shared_memory.SharedMemory(
-                        create=True, size=self.buffer_size
-                    )
-                    logger.debug(f"Created new buffer for job {job_id}")
-                except Exception as e:
-                    logger.warning(f"Failed to create shared memory buffer: {e}")
+            elif self.total_buffers < self.max_buffers:
+                buffer = self._create_buffer()
+                if buffer is None:
                     return None
+                logger.debug(f"Created new buffer for job {job_id}")
             else:
                 logger.warning(f"No buffers available for job {job_id}")
                 return None
@@ -1389,6 +1649,7 @@ class RenderBufferPool:
                     pass
             self.available_buffers.clear()
             self.in_use_buffers.clear()
+            self.total_buffers = 0
 
 
 class AsyncFileManager:
@@ -1419,7 +1680,7 @@ class AsyncFileManager:
                     self.preloaded_assets[asset_path] = data
                 logger.debug(f"Preloaded: {asset_path}")
         except Exception as e:
-            logger.error(f"Failed to preload {asset_path}: {e}")
+            logger.error("Failed to preload %s: %s", asset_path, e)
     
     def get_preloaded(self, asset_path):
         """Get preloaded asset data"""
@@ -1429,49 +1690,123 @@ class AsyncFileManager:
 class SystemMetricsCollector:
     """Collect system performance metrics"""
     
-    def __init__(self):
+    def __init__(self, collect_network=True, slow_ttl=5.0):
         self.process = psutil.Process()
+        self.collect_network = collect_network
+        self.slow_ttl = slow_ttl
+        self._net_cache = (0.0, None)
+        self._last_net = None
+        self._disk_cache = (0.0, None)
+        self.disk_path = os.path.abspath('.')
+        self.cpu_count = psutil.cpu_count()
+        psutil.cpu_percent(interval=None)
+        self._cpu = None
+        self._cpu_deadline = 0.0
+        self._m = dict.fromkeys((
+            'cpu_percent', 'cpu_count', 'memory_percent', 'memory_available_gb', 'disk_free_gb',
+            'disk_percent', 'net_tx_Bps', 'net_rx_Bps', 'worker_rss_mb', 'worker_threads', 'ts_ns'
+        ), 0)
+        self._m['cpu_count'] = self.cpu_count
+        self._m_lock = threading.Lock()
+        self._metrics_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='metrics')
+    
+    def start_cpu_sampler(self, loop, interval=1.0):
+        """Refresh the CPU reading every interval seconds as a timer on loop"""
+        self._cpu = psutil.cpu_percent(interval=None)
+        self._cpu_deadline = loop.time() + interval
+        loop.call_at(self._cpu_deadline, self._sample_cpu, loop, interval)
+    
+    def _sample_cpu(self, loop, interval):
+        self._cpu = psutil.cpu_percent(interval=None)
+        self._cpu_deadline = max(self._cpu_deadline + interval, loop.time())
+        loop.call_at(self._cpu_deadline, self._sample_cpu, loop, interval)
+    
+    def get_network(self):
+        """Return (tx, rx) bytes per second, refreshed at most once per slow_ttl"""
+        with self._m_lock:
+            ts, rates = self._net_cache
+            now = time.monotonic()
+            if rates is None or now - ts > self.slow_ttl:
+                counters = psutil.net_io_counters()
+                if self._last_net is None:
+                    rates = (0.0, 0.0)
+                else:
+                    last_t, last_sent, last_recv = self._last_net
+                    elapsed = max(1e-6, now - last_t)
+                    rates = (max(0, counters.bytes_sent - last_sent) / elapsed,
+                             max(0, counters.bytes_recv - last_recv) / elapsed)
+                self._last_net = (now, counters.bytes_sent, counters.bytes_recv)
+                self._net_cache = (now, rates)
+            return rates
+    
+    def get_disk(self):
+        """Return disk usage of the working volume, refreshed at most once per slow_ttl"""
+        with self._m_lock:
+            ts, disk = self._disk_cache
+            now = time.monotonic()
+            if disk is None or now - ts > self.slow_ttl:
+                disk = disk_usage(self.disk_path)
+                self._disk_cache = (now, disk)
+            return disk
+    
+    def get_process_stats(self):
+        """Return (rss, thread count) for the worker process"""
+        with self.process.oneshot():
+            return self.process.memory_info().rss, self.process.num_threads()
+    
+    def snapshot(self):
+        """Read system and worker process counters in one batch"""
+        cpu_percent = self._cpu
+        if cpu_percent is None:
+            cpu_percent = psutil.cpu_percent(interval=None)
+        
+        futures = [
+            self._metrics_pool.submit(psutil.virtual_memory),
+            self._metrics_pool.submit(self.get_disk),
+            self._metrics_pool.submit(self.get_network) if self.collect_network else None,
+            self._metrics_pool.submit(self.get_process_stats)
+        ]
+        wait_futures([f for f in futures if f is not None])
+        
+        results = []
+        for future in futures:
+            if future is None or future.exception() is not None:
+                if future is not None:
+                    logger.debug(f"Metric source failed: {future.exception()}")
+                results.append(None)
+            else:
+                results.append(future.result())
+        
+        memory, disk, network, process_stats = results
+        return cpu_percent, memory, disk, network, process_stats
+    
+    def shutdown(self):
+        """Release the metrics reader threads"""
+        self._metrics_pool.shutdown(wait=False)
     
     def get_current_metrics(self):
         """Get current system metrics"""
         try:
-            # CPU metrics
-            cpu_percent = psutil.cpu_percent(interval=1)
-            cpu_count = psutil.cpu_count()
-            
-            # Memory metrics
-            memory = psutil.virtual_memory()
-            memory_percent = memory.percent
-            memory_available_gb = memory.available / (1024**3)
-            
-            # Disk metrics
-            disk = psutil.disk_usage('.')
-            disk_free_gb = disk.free / (1024**3)
-            disk_percent = disk.percent
-            
-            # Network metrics
-            network = psutil.net_io_counters()
-            
-            return {
-                'cpu_percent': cpu_percent,
-                'cpu_count': cpu_count,
-                'memory_percent': memory_percent,
-                'memory_available_gb': round(memory_available_gb, 2),
-                'disk_free_gb': round(disk_free_gb, 2),
-                'disk_percent': disk_percent,
-                'network_bytes_sent': network.bytes_sent,
-                'network_bytes_recv': network.bytes_recv,
-                'timestamp': datetime.now().isoformat()
-            }
+            cpu_percent, memory, disk, network, process_stats = self.snapshot()
+            
+            process_rss, process_threads = process_stats or (0, 0)
+            
+            with self._m_lock:
+                m = self._m
+                m['cpu_percent'] = cpu_percent
+                m['memory_percent'] = memory.percent if memory else 0
+                m['memory_available_gb'] = memory.available / (1024**3) if memory else 0
+                m['disk_free_gb'] = disk.free / (1024**3) if disk else 0
+                m['disk_percent'] = disk.percent if disk else 0
+                m['net_tx_Bps'], m['net_rx_Bps'] = network or (0, 0)
+                m['worker_rss_mb'] = process_rss / (1024**2)
+                m['worker_threads'] = process_threads
+                m['ts_ns'] = time.time_ns()
+                return m.copy()
             
         except Exception as e:
-            logger.error(f"Metrics collection failed: {e}")
-            return {
-                'cpu_percent': 0,
-                'memory_percent': 0,
-                'disk_free_gb': 0,
-                'error': str(e)
-            }
+            logger.error("Metrics collection failed: %s", e)
+            return {**_METRICS_ERROR_TEMPLATE, 'error': str(e)}
 
 def main():
     parser = argparse.ArgumentParser(description='Production Render Farm Worker Node')
@@ -1494,13 +1829,6 @@ def main():
     logger.info("🎬 Production Render Farm Worker Node")
     logger.info("="*60)
     
-    # Check dependencies
-    try:
-        import psutil
-    except ImportError:
-        logger.error("psutil not installed. Run: pip install psutil")
-        sys.exit(1)
-    
     worker = ProductionRenderWorker(args.server, args.worker_id, args.config)
     
     try:
@@ -1508,7 +1836,7 @@ def main():
     except KeyboardInterrupt:
         worker.stop()
     except Exception as e:
-        logger.error(f"Fatal worker error: {e}")
+        logger.error("Fatal worker error: %s", e)
         worker.stop()
         sys.exit(1)
 
@@ -6,15 +6,133 @@ Creates a Windows-style installer for Server/Worker components
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import tkinter.font as tkfont
 import os
 import sys
 import platform
-import subprocess
 import threading
-import json
-import shutil
+import asyncio
+import queue
+import re
+import ipaddress
+from collections import deque
 from pathlib import Path
-import webbrowser
+
+PLATFORM_SYSTEM = platform.system()
+PLATFORM_RELEASE = platform.release()
+PLATFORM_MACHINE = platform.machine()
+PLATFORM_NODE = platform.node()
+PY_VERSION = sys.version.split()[0]
+
+COPY_CHUNK = 1 << 20
+
+PORT_RE = re.compile(r"^\d{1,5}$")
+HOSTNAME_RE = re.compile(r"^(?=.{1,253}$)[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?(?:\.[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?)*$")
+LOG_WIDGET_LINES = 500
+
+DEFAULT_FILE_CONTENTS = {
+    "config.json": b"{}\n",
+    "app_config.json": b"{}\n",
+    "server_config.json": b"{}\n",
+    "worker_config.json": b"{}\n",
+    "worker_machines.json": b'{"worker_machines": []}\n',
+}
+
+LAUNCHER_TEMPLATE = """@echo off
+title {title}
+cd /d "{install_path}"
+python {script}
+pause
+"""
+
+STARTUP_BAT_TEMPLATE = """@echo off
+cd /d "{install_path}"
+python "{script}"{args}
+"""
+
+DESKTOP_ENTRY_TEMPLATE = """[Desktop Entry]
+Name={name}
+Comment=VFX Render Farm {role}
+Exec={exec_cmd}
+Icon=applications-multimedia
+Terminal=false
+Type=Application
+Categories=Graphics;Video;
+"""
+
+SUMMARY_SERVER = """Server installation completed successfully!
+            
+Your Render Farm Server is now ready:
+• Web interface: http://localhost:8080
+• Desktop shortcut created
+• Service configured (if selected)
+
+Next steps:
+1. Launch the server application
+2. Configure worker machines
+3. Submit your first render job"""
+
+SUMMARY_WORKER_TEMPLATE = """Worker installation completed successfully!
+            
+Your Worker Node is now ready:
+• Server connection: {server_address}
+• Desktop shortcut created
+• Service configured (if selected)
+
+The worker will automatically:
+1. Connect to the server
+2. Register for render jobs
+3. Start processing tasks"""
+
+STEP_COLORS = {
+    "done": ("#198754", "#198754"),
+    "active": ("#0d6efd", "#0d6efd"),
+    "future": ("#dee2e6", "#6c757d"),
+}
+
+def _satisfied(spec):
+    """True if an installed distribution already meets the requirement spec"""
+    try:
+        from importlib import metadata as importlib_metadata
+    except ImportError:
+        return False
+    try:
+        from packaging.requirements import Requirement
+    except ImportError:
+        try:
+            from pip._vendor.packaging.requirements import Requirement
+        except ImportError:
+            return False
+    
+    requirement = Requirement(spec)
+    try:
+        installed = importlib_metadata.version(requirement.name)
+    except importlib_metadata.PackageNotFoundError:
+        return False
+    return requirement.specifier.contains(installed, prereleases=True)
+
+def _fast_copy(src, dst):
+    """Copy file contents only, in 1 MiB chunks"""
+    import shutil
+    binary = getattr(os, "O_BINARY", 0)
+    src_fd = os.open(src, os.O_RDONLY | binary)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | binary, 0o644)
+        try:
+            if hasattr(os, "sendfile") and PLATFORM_SYSTEM == "Linux":
+                offset = 0
+                while True:
+                    sent = os.sendfile(dst_fd, src_fd, offset, COPY_CHUNK)
+                    if sent == 0:
+                        break
+                    offset += sent
+            else:
+                with open(src_fd, "rb", closefd=False) as reader, open(dst_fd, "wb", closefd=False) as writer:
+                    shutil.copyfileobj(reader, writer, length=COPY_CHUNK)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
 
 class RenderFarmInstaller:
     def __init__(self):
@@ -27,6 +145,9 @@ class RenderFarmInstaller:
         # Center window
         self.center_window()
         
+        self._font_step = tkfont.Font(family="Segoe UI", size=9)
+        self._font_step_bold = tkfont.Font(family="Segoe UI", size=9, weight="bold")
+        
         # Variables
         self.install_type = tk.StringVar(value="server")
         self.install_path = tk.StringVar(value=self.get_default_install_path())
@@ -37,8 +158,21 @@ class RenderFarmInstaller:
         
         # Installation state
         self.installation_complete = False
+        self._install_loop = None
+        self._install_future = None
+        
+        self._ui_queue = queue.SimpleQueue()
+        self._drain_lock = threading.Lock()
+        self._drain_pending = False
+        self._pending_log = deque()
+        self._pending_progress = None
+        self._applied_progress = None
+        self._log_path = None
+        self._log_fh = None
+        self._wscript_shell = None
         
         self.create_gui()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
     def center_window(self):
         """Center the window on screen"""
@@ -49,7 +183,7 @@ class RenderFarmInstaller:
     
     def get_default_install_path(self):
         """Get default installation path"""
-        if platform.system() == "Windows":
+        if PLATFORM_SYSTEM == "Windows":
             return "C:\\Program Files\\RenderFarm"
         else:
             return "/opt/renderfarm"
@@ -93,61 +227,44 @@ class RenderFarmInstaller:
         progress_frame.pack(fill="x")
         progress_frame.pack_propagate(False)
         
-        # Progress container
-        progress_container = tk.Frame(progress_frame, bg="#f8f9fa")
-        progress_container.pack(expand=True, fill="both", pady=20)
-        
-        # Progress steps
-        self.progress_steps = []
         steps = ["Welcome", "Type", "Configuration", "Installation", "Complete"]
+        spacing = 130
+        left = (800 - spacing * (len(steps) - 1)) // 2
+        canvas = tk.Canvas(progress_frame, height=44, bg="#f8f9fa", highlightthickness=0)
+        canvas.pack(fill="x", expand=True)
+        self._progress_canvas = canvas
         
-        steps_container = tk.Frame(progress_container, bg="#f8f9fa")
-        steps_container.pack(expand=True)
+        self.progress_steps = []
+        self._step_states = ["future"] * len(steps)
         
         for i, step in enumerate(steps):
-            # Step frame
-            step_frame = tk.Frame(steps_container, bg="#f8f9fa")
-            step_frame.pack(side="left", padx=20)
-            
-            # Progress dot
-            dot_frame = tk.Frame(step_frame, bg="#f8f9fa")
-            dot_frame.pack()
-            
-            dot = tk.Label(dot_frame, text="●", font=("Segoe UI", 16), 
-                          fg="#dee2e6", bg="#f8f9fa")
-            dot.pack()
-            
-            # Step label
-            label = tk.Label(step_frame, text=step, 
-                            font=("Segoe UI", 9), fg="#6c757d", bg="#f8f9fa")
-            label.pack(pady=(5, 0))
-            
-            self.progress_steps.append((dot, label))
+            x = left + i * spacing
             
             # Add connector line (except for last step)
             if i < len(steps) - 1:
-                line_frame = tk.Frame(steps_container, bg="#f8f9fa", width=40, height=2)
-                line_frame.pack(side="left", pady=(8, 0))
-                line = tk.Label(line_frame, text="──", font=("Segoe UI", 8), 
-                               fg="#dee2e6", bg="#f8f9fa")
-                line.pack()
+                canvas.create_line(x + 16, 14, x + spacing - 16, 14, fill="#dee2e6", width=2)
+            
+            dot = canvas.create_oval(x - 6, 8, x + 6, 20, fill="#dee2e6", outline="")
+            label = canvas.create_text(x, 34, text=step, font=self._font_step, fill="#6c757d")
+            self.progress_steps.append((dot, label))
     
     def create_main_content(self):
         """Create main content area"""
         # Create pages list and current page tracker
         self.current_page = 0
-        self.pages = []
         
         # Create container for pages
         self.page_container = tk.Frame(self.root, bg="#ffffff")
         self.page_container.pack(fill="both", expand=True, padx=40, pady=30)
         
-        # Create all pages
-        self.create_welcome_page()
-        self.create_install_type_page()
-        self.create_config_page()
-        self.create_installation_page()
-        self.create_complete_page()
+        self._page_factories = [
+            self.create_welcome_page,
+            self.create_install_type_page,
+            self.create_config_page,
+            self.create_installation_page,
+            self.create_complete_page
+        ]
+        self.pages = [None] * len(self._page_factories)
     
     def create_bottom_navigation(self):
         """Create bottom navigation bar"""
@@ -191,10 +308,15 @@ class RenderFarmInstaller:
         """Show specific page"""
         # Hide all pages
         for page in self.pages:
-            page.pack_forget()
+            if page is not None:
+                page.pack_forget()
         
         # Show requested page
         if 0 <= page_index < len(self.pages):
+            if self.pages[page_index] is None:
+                self.pages[page_index] = self._page_factories[page_index]()
+            elif self._page_factories[page_index] == self.create_complete_page:
+                self.update_complete_summary()
             self.current_page = page_index
             self.pages[page_index].pack(fill="both", expand=True)
             self.update_progress_indicators()
@@ -204,22 +326,25 @@ class RenderFarmInstaller:
         """Update horizontal progress indicators"""
         for i, (dot, label) in enumerate(self.progress_steps):
             if i < self.current_page:
-                # Completed step
-                dot.config(fg="#198754")
-                label.config(fg="#198754", font=("Segoe UI", 9, "bold"))
+                state = "done"
             elif i == self.current_page:
-                # Current step
-                dot.config(fg="#0d6efd")
-                label.config(fg="#0d6efd", font=("Segoe UI", 9, "bold"))
+                state = "active"
             else:
-                # Future step
-                dot.config(fg="#dee2e6")
-                label.config(fg="#6c757d", font=("Segoe UI", 9))
+                state = "future"
+            
+            if self._step_states[i] == state:
+                continue
+            self._step_states[i] = state
+            
+            dot_fg, label_fg = STEP_COLORS[state]
+            self._progress_canvas.itemconfigure(dot, fill=dot_fg)
+            self._progress_canvas.itemconfigure(
+                label, fill=label_fg, font=self._font_step if state == "future" else self._font_step_bold
+            )
     
     def create_welcome_page(self):
         """Create welcome page"""
         page = tk.Frame(self.page_container, bg="#ffffff")
-        self.pages.append(page)
         
         # Welcome content with modern layout
         content = tk.Frame(page, bg="#ffffff")
@@ -250,18 +375,16 @@ class RenderFarmInstaller:
             "Optimized resource utilization and load balancing"
         ]
         
+        features_text = tk.Text(features_frame, height=len(features), relief="flat", bd=0,
+                                bg="#ffffff", cursor="arrow", highlightthickness=0, spacing1=3, spacing3=3)
+        features_text.tag_configure("check", foreground="#198754", font=("Segoe UI", 12, "bold"))
+        features_text.tag_configure("body", foreground="#495057", font=("Segoe UI", 11))
         for feature in features:
-            feature_frame = tk.Frame(features_frame, bg="#ffffff")
-            feature_frame.pack(fill="x", pady=3)
-            
-            # Checkmark icon (using Unicode)
-            check_label = tk.Label(feature_frame, text="✓", 
-                                  font=("Segoe UI", 12, "bold"), fg="#198754", bg="#ffffff")
-            check_label.pack(side="left", padx=(0, 10))
-            
-            feature_label = tk.Label(feature_frame, text=feature, 
-                                    font=("Segoe UI", 11), fg="#495057", bg="#ffffff")
-            feature_label.pack(side="left", anchor="w")
+            features_text.insert("end", "✓  ", "check")
+            features_text.insert("end", feature + "\n", "body")
+        features_text.delete("end-1c")
+        features_text.configure(state="disabled")
+        features_text.pack(fill="x")
         
         # System requirements in a modern card
         req_frame = tk.Frame(content, bg="#f8f9fa", relief="solid", bd=1)
@@ -281,15 +404,18 @@ class RenderFarmInstaller:
             "Network connectivity for distributed rendering"
         ]
         
-        for req in requirements:
-            req_item = tk.Label(req_content, text=f"• {req}", 
-                               font=("Segoe UI", 10), fg="#6c757d", bg="#f8f9fa")
-            req_item.pack(anchor="w", pady=2)
+        req_text = tk.Text(req_content, height=len(requirements), relief="flat", bd=0,
+                           bg="#f8f9fa", fg="#6c757d", font=("Segoe UI", 10), cursor="arrow",
+                           highlightthickness=0, spacing1=2, spacing3=2)
+        req_text.insert("end", "\n".join(f"• {req}" for req in requirements))
+        req_text.configure(state="disabled")
+        req_text.pack(fill="x")
+        
+        return page
     
     def create_install_type_page(self):
         """Create installation type selection page"""
         page = tk.Frame(self.page_container)
-        self.pages.append(page)
         
         # Header
         header_label = tk.Label(page, text="Choose Installation Type", 
@@ -342,17 +468,18 @@ class RenderFarmInstaller:
         info_frame = tk.LabelFrame(page, text="System Information", padx=10, pady=10)
         info_frame.pack(fill="x", pady=20)
         
-        system_info = f"OS: {platform.system()} {platform.release()}\\n"
-        system_info += f"Architecture: {platform.machine()}\\n"
-        system_info += f"Python: {sys.version.split()[0]}"
+        system_info = f"OS: {PLATFORM_SYSTEM} {PLATFORM_RELEASE}\\n"
+        system_info += f"Architecture: {PLATFORM_MACHINE}\\n"
+        system_info += f"Python: {PY_VERSION}"
         
         tk.Label(info_frame, text=system_info, justify="left", 
                 font=("Courier", 9)).pack(anchor="w")
+        
+        return page
     
     def create_config_page(self):
         """Create configuration page"""
         page = tk.Frame(self.page_container)
-        self.pages.append(page)
         
         tk.Label(page, text="Installation Configuration", 
                 font=("Arial", 16, "bold")).pack(pady=20)
@@ -391,11 +518,12 @@ class RenderFarmInstaller:
         
         # Update server frame visibility
         self.update_config_visibility()
+        
+        return page
     
     def create_installation_page(self):
         """Create installation progress page"""
         page = tk.Frame(self.page_container)
-        self.pages.append(page)
         
         tk.Label(page, text="Installing Render Farm", 
                 font=("Arial", 16, "bold")).pack(pady=20)
@@ -449,6 +577,8 @@ class RenderFarmInstaller:
         
         tk.Button(action_frame, text="📁 Open Install Folder", 
                  command=self.open_install_folder).pack(side="left", padx=10)
+        
+        return page
     
     def update_config_visibility(self):
         """Update configuration page based on install type"""
@@ -473,13 +603,12 @@ class RenderFarmInstaller:
         if self.current_page == 0:  # Welcome page
             self.show_page(1)
         elif self.current_page == 1:  # Type selection page
-            self.update_config_visibility()
             self.show_page(2)
+            self.update_config_visibility()
         elif self.current_page == 2:  # Configuration page
             if self.validate_configuration():
                 self.show_page(3)
-                # Start installation in background thread
-                threading.Thread(target=self.start_installation, daemon=True).start()
+                self.start_installation()
         elif self.current_page == 3:  # Installation page
             if self.installation_complete:
                 self.show_page(4)
@@ -514,78 +643,176 @@ class RenderFarmInstaller:
             return False
         
         if self.install_type.get() == "worker":
-            if not self.server_ip.get().strip():
+            if not self.is_valid_host(self.server_ip.get().strip()):
                 messagebox.showerror("Error", "Please specify the server IP address")
                 return False
             
-            try:
-                port = int(self.server_port.get())
-                if port < 1 or port > 65535:
-                    raise ValueError()
-            except ValueError:
+            match = PORT_RE.match(self.server_port.get().strip())
+            if not match or not 1 <= int(match.group()) <= 65535:
                 messagebox.showerror("Error", "Please specify a valid port number (1-65535)")
                 return False
         
         return True
     
+    def is_valid_host(self, host):
+        """True for an IPv4/IPv6 address or a syntactically valid hostname"""
+        if not host:
+            return False
+        if HOSTNAME_RE.match(host) and not all(label.isdigit() for label in host.split('.')):
+            return True
+        try:
+            ipaddress.ip_address(host)
+            return True
+        except ValueError:
+            return False
+    
+    def _schedule_drain(self):
+        """Schedule one drain of the pending UI updates unless one is already pending"""
+        with self._drain_lock:
+            if self._drain_pending:
+                return
+            self._drain_pending = True
+        self.root.after(30, self._drain_ui_queue)
+    
+    def _drain_ui_queue(self):
+        """Apply queued UI updates"""
+        with self._drain_lock:
+            self._drain_pending = False
+        self._flush_log()
+        try:
+            while True:
+                fn, args = self._ui_queue.get_nowait()
+                fn(*args)
+        except queue.Empty:
+            pass
+    
+    def _call_in_ui(self, fn, *args):
+        """Run fn now on the Tk thread, or queue it when called from another thread"""
+        if threading.current_thread() is threading.main_thread():
+            fn(*args)
+        else:
+            self._ui_queue.put((fn, args))
+            self._schedule_drain()
+    
     def log_message(self, message):
         """Add message to installation log"""
-        self.log_text.insert(tk.END, f"{message}\\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        self._pending_log.append(message)
+        self._schedule_drain()
     
     def update_progress(self, value, text):
         """Update progress bar and text"""
-        self.progress_var.set(value)
-        self.progress_text.set(text)
-        self.root.update_idletasks()
+        self._pending_progress = (value, text)
+        self._schedule_drain()
+    
+    def _flush_log(self):
+        """Write pending log lines in one insert and apply the latest progress"""
+        lines = []
+        while self._pending_log:
+            lines.append(self._pending_log.popleft())
+        if lines:
+            text = "\n".join(lines) + "\n"
+            if self._log_fh is None and self._log_path is not None:
+                self._log_fh = open(self._log_path, "w", encoding="utf-8", buffering=65536)
+                self._log_fh.write(self.log_text.get("1.0", "end-1c"))
+            if self._log_fh is not None:
+                self._log_fh.write(text)
+            
+            self.log_text.insert(tk.END, text)
+            excess = int(self.log_text.index("end-1c").split(".")[0]) - LOG_WIDGET_LINES
+            if excess > 0:
+                self.log_text.delete("1.0", f"{excess + 1}.0")
+            self.log_text.see(tk.END)
+        
+        progress = self._pending_progress
+        if progress is not None and progress is not self._applied_progress:
+            self._applied_progress = progress
+            self.progress_var.set(progress[0])
+            self.progress_text.set(progress[1])
+    
+    def _close_log(self):
+        """Flush remaining lines and close install.log"""
+        self._flush_log()
+        if self._log_fh is not None:
+            self._log_fh.close()
+            self._log_fh = None
+        self._log_path = None
+    
+    def _show_installation_complete(self):
+        self.complete_frame.pack(fill="x", pady=20)
+        self.installation_complete = True
+        self.update_navigation_buttons()
     
     def start_installation(self):
-        """Start the installation process"""
+        """Start the installation process on a background event loop"""
+        settings = {
+            "install_type": self.install_type.get(),
+            "install_path": Path(self.install_path.get()),
+            "server_ip": self.server_ip.get(),
+            "server_port": self.server_port.get(),
+            "create_shortcuts": self.create_shortcuts.get(),
+            "start_service": self.start_service.get(),
+        }
+        self._install_loop = asyncio.new_event_loop()
+        threading.Thread(target=self._install_loop.run_forever, daemon=True).start()
+        self._install_future = asyncio.run_coroutine_threadsafe(self._install_stages(settings), self._install_loop)
+        self._install_future.add_done_callback(
+            lambda _: self._install_loop.call_soon_threadsafe(self._install_loop.stop)
+        )
+    
+    def cancel_installation(self):
+        """Cancel the installation; the stage already running finishes first"""
+        if self._install_future is not None and not self._install_future.done():
+            self._install_future.cancel()
+    
+    def on_close(self):
+        """Close the window, cancelling any installation in progress"""
+        self.cancel_installation()
+        with self._drain_lock:
+            self._drain_pending = True
+        self._close_log()
+        self.root.destroy()
+    
+    async def _install_stages(self, settings):
+        """Run each installation step on a worker thread, one after another"""
+        loop = asyncio.get_event_loop()
+        stages = [
+            (10, "Checking system dependencies...", self.check_dependencies),
+            (20, "Creating installation directory...", self.create_install_directory),
+            (30, "Installing Python dependencies...", self.install_dependencies),
+            (50, "Copying application files...", self.copy_application_files),
+            (70, "Creating configuration...", self.create_configuration),
+            (85, "Setting up shortcuts and services...", self.setup_shortcuts_and_services),
+        ]
+        
         try:
             self.log_message("=== Render Farm Installation Started ===")
-            self.log_message(f"Install Type: {self.install_type.get().title()}")
-            self.log_message(f"Install Path: {self.install_path.get()}")
-            
-            # Step 1: Check dependencies
-            self.update_progress(10, "Checking system dependencies...")
-            self.check_dependencies()
-            
-            # Step 2: Create installation directory
-            self.update_progress(20, "Creating installation directory...")
-            self.create_install_directory()
+            self.log_message(f"Install Type: {settings['install_type'].title()}")
+            self.log_message(f"Install Path: {settings['install_path']}")
             
-            # Step 3: Install Python dependencies
-            self.update_progress(30, "Installing Python dependencies...")
-            self.install_dependencies()
+            for progress, text, stage in stages:
+                self.update_progress(progress, text)
+                await loop.run_in_executor(None, stage, settings)
             
-            # Step 4: Copy application files
-            self.update_progress(50, "Copying application files...")
-            self.copy_application_files()
-            
-            # Step 5: Create configuration
-            self.update_progress(70, "Creating configuration...")
-            self.create_configuration()
-            
-            # Step 6: Create shortcuts and services
-            self.update_progress(85, "Setting up shortcuts and services...")
-            self.setup_shortcuts_and_services()
-            
-            # Step 7: Complete
             self.update_progress(100, "Installation complete!")
             self.log_message("=== Installation Completed Successfully ===")
             
             # Show completion UI
-            self.complete_frame.pack(fill="x", pady=20)
-            self.installation_complete = True
-            self.update_navigation_buttons()
+            self._call_in_ui(self._show_installation_complete)
+        
+        except asyncio.CancelledError:
+            self.log_message("Installation cancelled")
+            self.update_progress(0, "Installation cancelled")
+            raise
             
         except Exception as e:
             self.log_message(f"ERROR: Installation failed: {str(e)}")
             self.update_progress(0, "Installation failed!")
-            messagebox.showerror("Installation Error", f"Installation failed:\\n{str(e)}")
+            self._call_in_ui(messagebox.showerror, "Installation Error", f"Installation failed:\\n{str(e)}")
+        
+        finally:
+            self._call_in_ui(self._close_log)
     
-    def check_dependencies(self):
+    def check_dependencies(self, settings):
         """Check system dependencies"""
         self.log_message("Checking Python installation...")
         
@@ -593,7 +820,7 @@ class RenderFarmInstaller:
         if sys.version_info < (3, 7):
             raise Exception("Python 3.7 or higher is required")
         
-        self.log_message(f"✓ Python {sys.version.split()[0]} found")
+        self.log_message(f"✓ Python {PY_VERSION} found")
         
         # Check pip
         try:
@@ -602,17 +829,18 @@ class RenderFarmInstaller:
         except ImportError:
             raise Exception("pip is not installed")
     
-    def create_install_directory(self):
+    def create_install_directory(self, settings):
         """Create installation directory"""
-        install_path = Path(self.install_path.get())
+        install_path = settings["install_path"]
         
         try:
             install_path.mkdir(parents=True, exist_ok=True)
+            self._log_path = install_path / "install.log"
             self.log_message(f"✓ Created directory: {install_path}")
         except Exception as e:
             raise Exception(f"Failed to create install directory: {e}")
     
-    def install_dependencies(self):
+    def install_dependencies(self, settings):
         """Install Python dependencies"""
         dependencies = [
             "PyQt5>=5.15.0",
@@ -621,24 +849,60 @@ class RenderFarmInstaller:
             "aiofiles>=0.8.0"
         ]
         
-        if self.install_type.get() == "server":
+        if settings["install_type"] == "server":
             dependencies.extend([
                 "paramiko>=2.7.0",
                 "pywinrm>=0.4.0"
             ])
         
+        missing = []
         for dep in dependencies:
-            self.log_message(f"Installing {dep}...")
-            try:
-                subprocess.run([sys.executable, "-m", "pip", "install", dep], 
-                             check=True, capture_output=True, text=True)
-                self.log_message(f"✓ Installed {dep}")
-            except subprocess.CalledProcessError as e:
-                self.log_message(f"⚠ Warning: Failed to install {dep}")
+            if _satisfied(dep):
+                self.log_message(f"✓ {dep} already satisfied")
+            else:
+                missing.append(dep)
+        
+        if not missing:
+            return
+        dependencies = missing
+        
+        cache_dir = settings["install_path"] / "_wheel_cache"
+        self.log_message(f"Downloading {', '.join(dependencies)}...")
+        returncode = self.run_pip("download", "--dest", str(cache_dir), "--prefer-binary", *dependencies)
+        
+        if returncode == 0:
+            self.log_message(f"Installing {len(dependencies)} packages from {cache_dir}...")
+            returncode = self.run_pip("install", "--no-index", "--find-links", str(cache_dir), *dependencies)
+        else:
+            self.log_message("Installing directly from the package index...")
+            returncode = self.run_pip("install", "--prefer-binary", *dependencies)
+        
+        if returncode == 0:
+            self.log_message(f"✓ Installed {len(dependencies)} packages")
+        else:
+            self.log_message(f"⚠ Warning: pip exited with code {returncode}, some packages may be missing")
     
-    def copy_application_files(self):
+    def run_pip(self, *args):
+        """Run one pip command quietly; its error output is logged only on failure"""
+        import subprocess
+        command = [sys.executable, "-m", "pip", *args[:1], "--disable-pip-version-check",
+                   "--no-input", *args[1:]]
+        try:
+            result = subprocess.run(command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                    stderr=subprocess.PIPE)
+        except OSError as e:
+            self.log_message(f"⚠ Warning: Failed to run pip: {e}")
+            return -1
+        
+        if result.returncode != 0:
+            for line in result.stderr.decode(errors="replace").splitlines():
+                if line.strip():
+                    self.log_message(f"  {line.rstrip()}")
+        return result.returncode
+    
+    def copy_application_files(self, settings):
         """Copy application files to installation directory"""
-        install_path = Path(self.install_path.get())
+        install_path = settings["install_path"]
         source_path = Path(__file__).parent
         
         # Core files for both server and worker
@@ -650,7 +914,7 @@ class RenderFarmInstaller:
             "app_config.json",
         ]
         
-        if self.install_type.get() == "server":
+        if settings["install_type"] == "server":
             files_to_copy.extend([
                 "main_app.py",
                 "server.py", 
@@ -666,114 +930,149 @@ class RenderFarmInstaller:
                 "worker_config.json"
             ])
         
+        with os.scandir(source_path) as it:
+            entries = {entry.name: entry for entry in it}
+        
+        copied_times = []
         total_files = len(files_to_copy)
         for i, filename in enumerate(files_to_copy):
             progress = 50 + (i * 20 // total_files)  # Progress from 50 to 70
             self.update_progress(progress, f"Copying {filename}...")
             
-            src_file = source_path / filename
-            if src_file.exists():
+            entry = entries.get(filename)
+            if entry is not None and entry.is_file():
                 dst_file = install_path / filename
-                shutil.copy2(src_file, dst_file)
+                _fast_copy(entry.path, dst_file)
+                copied_times.append((dst_file, entry.stat().st_mtime_ns))
                 self.log_message(f"✓ Copied {filename}")
             else:
                 self.log_message(f"⚠ Warning: {filename} not found")
-                # Create empty file if it doesn't exist
                 dst_file = install_path / filename
-                dst_file.touch()
+                dst_file.write_bytes(DEFAULT_FILE_CONTENTS.get(filename, b""))
+        
+        for dst_file, mtime_ns in copied_times:
+            os.utime(dst_file, ns=(mtime_ns, mtime_ns))
     
-    def create_configuration(self):
+    def create_configuration(self, settings):
         """Create configuration files"""
-        install_path = Path(self.install_path.get())
+        import json
+        install_path = settings["install_path"]
+        server_port = settings["server_port"]
         
-        if self.install_type.get() == "worker":
+        if settings["install_type"] == "worker":
             # Create worker config
             worker_config = {
-                "server_url": f"http://{self.server_ip.get()}:{self.server_port.get()}",
-                "worker_id": f"worker_{platform.node()}",
+                "server_url": f"http://{settings['server_ip']}:{server_port}",
+                "worker_id": f"worker_{PLATFORM_NODE}",
                 "auto_start": True,
                 "max_concurrent_jobs": 4
             }
             
             config_file = install_path / "worker_config.json"
-            with open(config_file, 'w') as f:
-                json.dump(worker_config, f, indent=2)
+            config_file.write_text(json.dumps(worker_config, indent=2), encoding="utf-8")
             
             self.log_message(f"✓ Created worker configuration")
         
         else:  # Server
             # Create server config
             server_config = {
-                "port": int(self.server_port.get()),
+                "port": int(server_port),
                 "host": "",
                 "database_path": str(install_path / "render_farm.db")
             }
             
             config_file = install_path / "server_config.json"
-            with open(config_file, 'w') as f:
-                json.dump(server_config, f, indent=2)
+            config_file.write_text(json.dumps(server_config, indent=2), encoding="utf-8")
             
             self.log_message(f"✓ Created server configuration")
     
-    def setup_shortcuts_and_services(self):
+    def setup_shortcuts_and_services(self, settings):
         """Create shortcuts and services"""
-        install_path = Path(self.install_path.get())
+        files = self.launcher_script_files(settings)
         
-        # Create launcher scripts
-        self.create_launcher_scripts(install_path)
+        if settings["create_shortcuts"]:
+            if PLATFORM_SYSTEM == "Windows":
+                self.create_windows_shortcuts(settings)
+            else:
+                files += self.linux_shortcut_files(settings)
         
-        if self.create_shortcuts.get():
-            if platform.system() == "Windows":
-                self.create_windows_shortcuts(install_path)
+        if settings["start_service"]:
+            if PLATFORM_SYSTEM == "Windows":
+                files += self.windows_startup_files(settings)
             else:
-                self.create_linux_shortcuts(install_path)
+                self.create_linux_service(settings["install_path"])
         
-        if self.start_service.get():
-            self.create_startup_service(install_path)
+        self._emit_install_files(files)
     
-    def create_launcher_scripts(self, install_path):
-        """Create launcher scripts"""
-        if self.install_type.get() == "server":
-            # Create server launcher
-            server_launcher = f"""@echo off
-title Render Farm Server
-cd /d "{install_path}"
-python main_app.py
-pause
-"""
-            launcher_file = install_path / "start_server.bat"
-            with open(launcher_file, 'w') as f:
-                f.write(server_launcher)
-            self.log_message("✓ Created server launcher script")
-        else:
-            # Create worker launcher  
-            worker_launcher = f"""@echo off
-title Render Farm Worker
-cd /d "{install_path}"
-python worker_node.py
-pause
-"""
-            launcher_file = install_path / "start_worker.bat"
-            with open(launcher_file, 'w') as f:
-                f.write(worker_launcher)
-            self.log_message("✓ Created worker launcher script")
+    def _write_text(self, path, content, newline="\n"):
+        """Write a small generated file straight to its descriptor, no text layer"""
+        if newline != "\n":
+            content = content.replace("\n", newline)
+        data = memoryview(content.encode('utf-8'))
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+    
+    def _emit_install_files(self, files):
+        """Write (path, content, done, failed, mode) entries grouped by directory
+        
+        A failed write of an entry without a failure message aborts the install.
+        """
+        for path, content, done, failed, mode in sorted(files, key=lambda f: str(f[0].parent)):
+            try:
+                self._write_text(path, content, "\r\n" if path.suffix == ".bat" else "\n")
+                if mode is not None:
+                    path.chmod(mode)
+            except Exception as e:
+                if failed is None:
+                    raise
+                self.log_message(f"{failed}: {e}")
+                continue
+            self.log_message(done)
     
-    def create_windows_shortcuts(self, install_path):
+    def launcher_script_files(self, settings):
+        """Launcher script for the selected component"""
+        install_path = settings["install_path"]
+        if settings["install_type"] == "server":
+            server_launcher = LAUNCHER_TEMPLATE.format(
+                title="Render Farm Server", install_path=install_path, script="main_app.py")
+            return [(install_path / "start_server.bat", server_launcher,
+                     "✓ Created server launcher script", None, None)]
+        worker_launcher = LAUNCHER_TEMPLATE.format(
+            title="Render Farm Worker", install_path=install_path, script="worker_node.py")
+        return [(install_path / "start_worker.bat", worker_launcher,
+                 "✓ Created worker launcher script", None, None)]
+    
+    def _get_wscript_shell(self):
+        """Return the shared WScript.Shell dispatch, creating it once"""
+        if self._wscript_shell is None:
+            from win32com.client import Dispatch
+            self._wscript_shell = Dispatch('WScript.Shell')
+        return self._wscript_shell
+    
+    def create_windows_shortcuts(self, settings):
         """Create Windows shortcuts"""
         try:
             import winshell
-            from win32com.client import Dispatch
-            
+            shell = self._get_wscript_shell()
+        except ImportError:
+            self.log_message("⚠ pywin32 not available, skipping shortcuts")
+            return
+        
+        try:
             desktop = winshell.desktop()
+            install_path = settings["install_path"]
             
-            if self.install_type.get() == "server":
+            if settings["install_type"] == "server":
                 shortcut_name = "Render Farm Server"
                 target = str(install_path / "main_app.py")
             else:
                 shortcut_name = "Render Farm Worker"
                 target = str(install_path / "worker_node.py")
             
-            shell = Dispatch('WScript.Shell')
             shortcut = shell.CreateShortCut(os.path.join(desktop, f"{shortcut_name}.lnk"))
             shortcut.Targetpath = sys.executable
             shortcut.Arguments = f'"{target}"'
@@ -783,83 +1082,60 @@ pause
             
             self.log_message(f"✓ Created desktop shortcut: {shortcut_name}")
             
-        except ImportError:
-            self.log_message("⚠ pywin32 not available, skipping shortcuts")
         except Exception as e:
             self.log_message(f"⚠ Failed to create shortcuts: {e}")
     
-    def create_linux_shortcuts(self, install_path):
-        """Create Linux desktop shortcuts"""
+    def linux_shortcut_files(self, settings):
+        """Linux desktop entry for the selected component"""
         try:
             desktop_dir = Path.home() / "Desktop"
             if not desktop_dir.exists():
                 desktop_dir = Path.home() / ".local" / "share" / "applications"
                 desktop_dir.mkdir(parents=True, exist_ok=True)
-            
-            if self.install_type.get() == "server":
-                shortcut_name = "render-farm-server"
-                exec_cmd = f'python3 "{install_path / "main_app.py"}"'
-                display_name = "Render Farm Server"
-            else:
-                shortcut_name = "render-farm-worker"
-                exec_cmd = f'python3 "{install_path / "worker_node.py"}"'
-                display_name = "Render Farm Worker"
-            
-            desktop_content = f"""[Desktop Entry]
-Name={display_name}
-Comment=VFX Render Farm {self.install_type.get().title()}
-Exec={exec_cmd}
-Icon=applications-multimedia
-Terminal=false
-Type=Application
-Categories=Graphics;Video;
-"""
-            
-            shortcut_file = desktop_dir / f"{shortcut_name}.desktop"
-            with open(shortcut_file, 'w') as f:
-                f.write(desktop_content)
-            
-            # Make executable
-            shortcut_file.chmod(0o755)
-            
-            self.log_message(f"✓ Created desktop shortcut: {display_name}")
-            
         except Exception as e:
             self.log_message(f"⚠ Failed to create shortcuts: {e}")
-    
-    def create_startup_service(self, install_path):
-        """Create startup service/script"""
-        if platform.system() == "Windows":
-            self.create_windows_service(install_path)
+            return []
+        
+        install_path = settings["install_path"]
+        install_type = settings["install_type"]
+        if install_type == "server":
+            shortcut_name = "render-farm-server"
+            exec_cmd = f'python3 "{install_path / "main_app.py"}"'
+            display_name = "Render Farm Server"
         else:
-            self.create_linux_service(install_path)
+            shortcut_name = "render-farm-worker"
+            exec_cmd = f'python3 "{install_path / "worker_node.py"}"'
+            display_name = "Render Farm Worker"
+        
+        desktop_content = DESKTOP_ENTRY_TEMPLATE.format(
+            name=display_name, role=install_type.title(), exec_cmd=exec_cmd)
+        
+        return [(desktop_dir / f"{shortcut_name}.desktop", desktop_content,
+                 f"✓ Created desktop shortcut: {display_name}",
+                 "⚠ Failed to create shortcuts", 0o755)]
     
-    def create_windows_service(self, install_path):
-        """Create Windows startup script"""
+    def windows_startup_files(self, settings):
+        """Windows startup script for the selected component"""
         try:
             startup_folder = Path(os.environ["APPDATA"]) / "Microsoft" / "Windows" / "Start Menu" / "Programs" / "Startup"
-            
-            if self.install_type.get() == "server":
-                script_name = "RenderFarmServer.bat"
-                script_content = f'''@echo off
-cd /d "{install_path}"
-python "{install_path / "main_app.py"}"
-'''
-            else:
-                script_name = "RenderFarmWorker.bat"
-                script_content = f'''@echo off
-cd /d "{install_path}"
-python "{install_path / "worker_node.py"}" --server {self.server_ip.get()}:{self.server_port.get()}
-'''
-            
-            script_file = startup_folder / script_name
-            with open(script_file, 'w') as f:
-                f.write(script_content)
-            
-            self.log_message(f"✓ Created startup script: {script_name}")
-            
-        except Exception as e:
+        except KeyError as e:
             self.log_message(f"⚠ Failed to create startup script: {e}")
+            return []
+        
+        install_path = settings["install_path"]
+        if settings["install_type"] == "server":
+            script_name = "RenderFarmServer.bat"
+            script_content = STARTUP_BAT_TEMPLATE.format(
+                install_path=install_path, script=install_path / "main_app.py", args="")
+        else:
+            script_name = "RenderFarmWorker.bat"
+            script_content = STARTUP_BAT_TEMPLATE.format(
+                install_path=install_path, script=install_path / "worker_node.py",
+                args=f" --server {settings['server_ip']}:{settings['server_port']}")
+        
+        return [(startup_folder / script_name, script_content,
+                 f"✓ Created startup script: {script_name}",
+                 "⚠ Failed to create startup script", None)]
     
     def create_linux_service(self, install_path):
         """Create Linux systemd service"""
@@ -868,6 +1144,7 @@ python "{install_path / "worker_node.py"}" --server {self.server_ip.get()}:{self
     
     def launch_application(self):
         """Launch the installed application"""
+        import subprocess
         install_path = Path(self.install_path.get())
         
         try:
@@ -876,12 +1153,14 @@ python "{install_path / "worker_node.py"}" --server {self.server_ip.get()}:{self
             else:
                 script = install_path / "worker_node.py"
             
-            if platform.system() == "Windows":
-                subprocess.Popen([sys.executable, str(script)], 
-                               cwd=str(install_path))
+            if PLATFORM_SYSTEM == "Windows":
+                subprocess.Popen([sys.executable, str(script)],
+                               cwd=str(install_path), close_fds=True,
+                               creationflags=subprocess.CREATE_NEW_PROCESS_GROUP)
             else:
-                subprocess.Popen([sys.executable, str(script)], 
-                               cwd=str(install_path))
+                subprocess.Popen([sys.executable, str(script)],
+                               cwd=str(install_path), close_fds=True,
+                               start_new_session=True)
             
             self.log_message("✓ Application launched")
             
@@ -890,18 +1169,28 @@ python "{install_path / "worker_node.py"}" --server {self.server_ip.get()}:{self
     
     def open_install_folder(self):
         """Open installation folder"""
+        import subprocess
         install_path = self.install_path.get()
         
-        if platform.system() == "Windows":
+        if PLATFORM_SYSTEM == "Windows":
             os.startfile(install_path)
-        elif platform.system() == "Darwin":  # macOS
+        elif PLATFORM_SYSTEM == "Darwin":  # macOS
             subprocess.run(["open", install_path])
         else:  # Linux
             subprocess.run(["xdg-open", install_path])
+    
+    def update_complete_summary(self):
+        """Set the complete page summary for the chosen install type"""
+        if self.install_type.get() == "server":
+            summary_text = SUMMARY_SERVER
+        else:
+            summary_text = SUMMARY_WORKER_TEMPLATE.format(
+                server_address=f"{self.server_ip.get()}:{self.server_port.get()}")
+        self._summary_label.config(text=summary_text)
+    
     def create_complete_page(self):
         """Create installation complete page"""
         page = tk.Frame(self.page_container)
-        self.pages.append(page)
         
         # Success content
         success_frame = tk.Frame(page)
@@ -912,35 +1201,9 @@ python "{install_path / "worker_node.py"}" --server {self.server_ip.get()}:{self
                                 font=("Arial", 18, "bold"), fg="#27ae60")
         success_label.pack(pady=(0, 20))
         
-        # Summary based on installation type
-        if self.install_type.get() == "server":
-            summary_text = """Server installation completed successfully!
-            
-Your Render Farm Server is now ready:
-• Web interface: http://localhost:8080
-• Desktop shortcut created
-• Service configured (if selected)
-
-Next steps:
-1. Launch the server application
-2. Configure worker machines
-3. Submit your first render job"""
-        else:
-            summary_text = f"""Worker installation completed successfully!
-            
-Your Worker Node is now ready:
-• Server connection: {self.server_ip.get()}:{self.server_port.get()}
-• Desktop shortcut created
-• Service configured (if selected)
-
-The worker will automatically:
-1. Connect to the server
-2. Register for render jobs
-3. Start processing tasks"""
-        
-        summary_label = tk.Label(success_frame, text=summary_text, 
-                                font=("Arial", 10), justify="left")
-        summary_label.pack(pady=20)
+        self._summary_label = tk.Label(success_frame, font=("Arial", 10), justify="left")
+        self._summary_label.pack(pady=20)
+        self.update_complete_summary()
         
         # Action buttons
         action_frame = tk.Frame(success_frame)
@@ -957,6 +1220,8 @@ The worker will automatically:
                               bg="#95a5a6", fg="white", font=("Arial", 10, "bold"),
                               width=15)
         finish_btn.pack(side="left", padx=10)
+        
+        return page
     
     def run(self):
         """Run the installer"""
@@ -965,7 +1230,7 @@ The worker will automatically:
 def main():
     """Main entry point"""
     # Check if running as admin/root
-    if platform.system() == "Windows":
+    if PLATFORM_SYSTEM == "Windows":
         try:
             import ctypes
             is_admin = ctypes.windll.shell32.IsUserAnAdmin()